@@ -0,0 +1,115 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides process-wide Google Cloud API clients shared by
+the adapters. Creating a gRPC client opens a new channel and fetches
+credentials, so every adapter instance reuses the same client instead.
+"""
+
+import threading
+from functools import wraps
+from typing import Callable, TypeVar
+
+from google.api_core.gapic_v1.client_info import ClientInfo
+from google.cloud import asset
+from google.cloud import cloudquotas_v1
+from google.cloud import datacatalog
+from google.cloud import dataplex
+from google.cloud import resourcemanager
+from google.cloud.datacatalog_v1.services.data_catalog.transports import (
+    DataCatalogGrpcTransport,
+)
+
+T = TypeVar("T")
+
+USER_AGENT = "TransferTooling/1.0.0"
+
+# Keepalive pings keep long-lived channels from being silently dropped
+# between bursts of requests issued by the bulk methods.
+GRPC_CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+]
+
+_lock = threading.Lock()
+
+
+def shared_client(factory: Callable[[], T]) -> Callable[[], T]:
+    """
+    Decorator that makes a client factory create its client only once
+    per process and return the same instance on subsequent calls.
+    """
+    instance = None
+
+    @wraps(factory)
+    def inner() -> T:
+        nonlocal instance
+        if instance is None:
+            with _lock:
+                if instance is None:
+                    instance = factory()
+        return instance
+
+    return inner
+
+
+@shared_client
+def get_asset_client() -> asset.AssetServiceClient:
+    """
+    Returns the shared Cloud Asset client.
+    """
+    return asset.AssetServiceClient()
+
+
+@shared_client
+def get_data_catalog_client() -> datacatalog.DataCatalogClient:
+    """
+    Returns the shared Data Catalog client.
+    """
+    channel = DataCatalogGrpcTransport.create_channel(
+        options=GRPC_CHANNEL_OPTIONS
+    )
+    return datacatalog.DataCatalogClient(
+        transport=DataCatalogGrpcTransport(channel=channel),
+        client_info=ClientInfo(user_agent=USER_AGENT),
+    )
+
+
+@shared_client
+def get_quotas_client() -> cloudquotas_v1.CloudQuotasClient:
+    """
+    Returns the shared Cloud Quotas client.
+    """
+    return cloudquotas_v1.CloudQuotasClient()
+
+
+@shared_client
+def get_catalog_service_client() -> dataplex.CatalogServiceClient:
+    """
+    Returns the shared Dataplex Catalog Service client.
+    """
+    return dataplex.CatalogServiceClient(
+        client_info=ClientInfo(user_agent=USER_AGENT),
+    )
+
+
+@shared_client
+def get_projects_client() -> resourcemanager.ProjectsClient:
+    """
+    Returns the shared Resource Manager Projects client.
+    """
+    return resourcemanager.ProjectsClient()
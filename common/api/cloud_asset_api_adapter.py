@@ -23,13 +23,20 @@ Classes:
   with the Data Catalog API.
 """
 
-from google.api_core.exceptions import PermissionDenied
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+from google.api_core import retry as retries
+from google.api_core.exceptions import PermissionDenied, ResourceExhausted
 from google.cloud import asset
 from google.cloud.asset_v1.services.asset_service.pagers import (
     SearchAllResourcesPager,
 )
+from google.cloud.asset_v1.types import SearchAllResourcesResponse
 
+from common.api.clients import get_asset_client
 from common.entities import Project
+from common.utils import get_logger
 
 
 class CloudAssetApiAdapter:
@@ -37,40 +44,97 @@ class CloudAssetApiAdapter:
     An adapter class for interacting with the Google Cloud Asset API.
     """
 
+    # Maximum page size accepted by SearchAllResources.
+    PAGE_SIZE = 500
+
     def __init__(self, organization: str) -> None:
         """
         Initializes the AssetApiAdapter with a AssetService client.
         """
-        self._client = asset.AssetServiceClient()
-        self.organization = f"organizations/{organization}"
+        self._client = get_asset_client()
+        self.organization = (
+            f"organizations/{organization}" if organization else None
+        )
+        self._logger = get_logger()
+        self._retry = retries.Retry(
+            predicate=retries.if_exception_type(ResourceExhausted),
+            initial=1.0,
+            maximum=60.0,
+            multiplier=2.0,
+            timeout=600.0,
+        )
 
     def fetch_projects(self) -> list[Project]:
         """
         Fetches all projects within the organization which have
         datacatalog or dataplex API enabled.
         """
-        response = list(
-            self._search(
-                self.organization,
-                ["serviceusage.googleapis.com/Service"],
-                "name:(datacatalog.googleapis.com OR dataplex.googleapis.com)",
+        if self.organization is None:
+            self._logger.warning(
+                "No organization to search projects in. Skipping."
             )
+            return []
+
+        pages = self._search_pages(
+            self.organization,
+            ["serviceusage.googleapis.com/Service"],
+            "name:(datacatalog.googleapis.com OR dataplex.googleapis.com)",
         )
 
-        return list(map(Project.proto_to_project, response))
+        return [
+            Project.proto_to_project(msg)
+            for page in pages
+            for msg in page.results
+        ]
 
-    def _search(
+    def _search_pages(
         self, scope: str, asset_types: list[str], query: str
+    ) -> Iterator[SearchAllResourcesResponse]:
+        """
+        Yields the search result pages one by one. Pages are chained by
+        their page tokens, so the next page is requested in the background
+        while the current one is being processed by the caller. The same
+        request is reused for every page, only its page token changes.
+        """
+        request = asset.SearchAllResourcesRequest(
+            scope=scope,
+            asset_types=asset_types,
+            query=query,
+            page_size=self.PAGE_SIZE,
+        )
+        page = self._search_page(request)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while page.next_page_token:
+                request.page_token = page.next_page_token
+                next_page = executor.submit(self._search_page, request)
+                yield page
+                page = next_page.result()
+
+        yield page
+
+    def _search_page(
+        self, request: asset.SearchAllResourcesRequest
+    ) -> SearchAllResourcesResponse:
+        """
+        Fetches a single page of the search results.
+        """
+        return next(self._search(request).pages)
+
+    def _search(
+        self, request: asset.SearchAllResourcesRequest
     ) -> SearchAllResourcesPager:
         """
-        Performs a search in the Assets with the specified scope and query.
+        Performs a search in the Assets with the specified request.
+        Requests rejected with RESOURCE_EXHAUSTED are retried with
+        exponential backoff and jitter.
         """
         try:
             return self._client.search_all_resources(
-                scope=scope, asset_types=asset_types, query=query
+                request=request, retry=self._retry
             )
         except PermissionDenied as e:
             raise PermissionDenied(
-                f"Not enough permissions for scope {scope} "
+                f"Not enough permissions for scope {request.scope} "
                 f"or scope doesn't exists"
             ) from e
@@ -17,12 +17,14 @@ This module provides an adapter for interacting with Google Cloud Quotas API.
 """
 
 from enum import StrEnum
+from functools import lru_cache
 from math import ceil
 
 from google.cloud import cloudquotas_v1
 from google.api_core.exceptions import GoogleAPICallError, NotFound
 
-from common.utils import get_logger
+from common.api.clients import get_quotas_client
+from common.utils import get_logger, TokenBucket
 
 
 class Services(StrEnum):
@@ -51,6 +53,30 @@ class Quotas(StrEnum):
     )
 
 
+@lru_cache(maxsize=512)
+def _get_quota_info(
+    client: cloudquotas_v1.CloudQuotasClient, name: str
+) -> cloudquotas_v1.QuotaInfo:
+    """
+    Retrieves a quota info. Quota values do not change during a run, so
+    successful responses are cached for the whole process.
+    """
+    request = cloudquotas_v1.GetQuotaInfoRequest(name=name)
+    return client.get_quota_info(request=request)
+
+
+@lru_cache(maxsize=512)
+def _list_quota_infos(
+    client: cloudquotas_v1.CloudQuotasClient, parent: str
+) -> tuple[cloudquotas_v1.QuotaInfo, ...]:
+    """
+    Lists all quota infos of a service. Successful responses are cached
+    for the whole process.
+    """
+    request = cloudquotas_v1.ListQuotaInfosRequest(parent=parent)
+    return tuple(client.list_quota_infos(request=request))
+
+
 class QuotaInfoAdapter:
     """
     Adapter for interacting with the Google Cloud Quotas API.
@@ -60,7 +86,7 @@ class QuotaInfoAdapter:
         """
         Initialize the QuotaInfoAdapter.
         """
-        self._client = cloudquotas_v1.CloudQuotasClient()
+        self._client = get_quotas_client()
         self._logger = get_logger()
 
     def get_default_quota_value(
@@ -74,10 +100,8 @@ class QuotaInfoAdapter:
             f"services/{service}/quotaInfos/{quota}"
         )
 
-        request = cloudquotas_v1.GetQuotaInfoRequest({"name": resource_name})
-
         try:
-            response = self._client.get_quota_info(request=request)
+            response = _get_quota_info(self._client, resource_name)
         except NotFound:
             self._logger.error(
                 "Quota information not found for resource: %s", resource_name
@@ -96,16 +120,28 @@ class QuotaInfoAdapter:
         quota_value = ceil(min(quota_values) / 60)
         return quota_value
 
+    def create_rate_limiter(
+        self, project: str, service: str, quota: str
+    ) -> TokenBucket | None:
+        """
+        Creates a token bucket refilled at the per-second rate allowed by the
+        given quota, or returns None if the quota value is unavailable.
+        """
+        quota_value = self.get_default_quota_value(project, service, quota)
+
+        if not quota_value:
+            return None
+
+        return TokenBucket(quota_value)
+
     def list_all_quotas_for_service(self, project: str, service: str) -> list:
         """
         List all quotas for a specific service in the project.
         """
         parent = f"projects/{project}/locations/global/services/{service}"
 
-        request = cloudquotas_v1.ListQuotaInfosRequest({"parent": parent})
-
         try:
-            page_result = self._client.list_quota_infos(request=request)
+            page_result = _list_quota_infos(self._client, parent)
         except NotFound:
             self._logger.error(
                 "Service quotas not found for project '%s' and service '%s'.",
@@ -122,24 +158,20 @@ class QuotaInfoAdapter:
         quotas = []
 
         for quota_info in page_result:
-            quota_data = {
-                "quota_id": quota_info.quota_id,
-                "display_name": quota_info.metric_display_name,
-                "values": {},
-            }
+            values = {}
 
             for dimension_info in quota_info.dimensions_infos:
-                if dimension_info.applicable_locations:
-                    for region in dimension_info.applicable_locations:
-                        quota_data["values"][
-                            region
-                        ] = dimension_info.details.value
-                else:
-                    quota_data["values"][
-                        "common"
-                    ] = dimension_info.details.value
-
-            quotas.append(quota_data)
+                value = dimension_info.details.value
+                regions = dimension_info.applicable_locations or ["common"]
+                values.update(dict.fromkeys(regions, value))
+
+            quotas.append(
+                {
+                    "quota_id": quota_info.quota_id,
+                    "display_name": quota_info.metric_display_name,
+                    "values": values,
+                }
+            )
 
         self._logger.info(
             "Retrieved %d quotas for service '%s' in project '%s'.",
@@ -23,10 +23,16 @@ Classes:
 with the Data Catalog API.
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from enum import StrEnum
+from threading import Lock
+from typing import Any, Callable, Iterator
 
+from cachetools import TTLCache
+from google.api_core import retry as retries
 from google.api_core.exceptions import NotFound, GoogleAPIError
-from google.api_core.gapic_v1.client_info import ClientInfo
 from google.cloud import datacatalog
 from google.cloud.datacatalog_v1 import DeleteEntryGroupRequest
 from google.cloud.datacatalog_v1.types import (
@@ -39,9 +45,15 @@ from google.cloud.datacatalog_v1.services.data_catalog.pagers import (
     SearchCatalogPager,
 )
 
-from common.entities import EntryGroup, TagTemplate
+from common.api.clients import get_data_catalog_client
+from common.api.cloud_quotas_api_adapter import (
+    QuotaInfoAdapter,
+    Services,
+    Quotas,
+)
+from common.entities import EntryGroup, TagTemplate, Binding
 from common.exceptions import IncorrectTypeException
-from common.utils import get_logger
+from common.utils import get_logger, fan_out, TokenBucket
 
 
 class DatacatalogApiAdapter:
@@ -53,91 +65,204 @@ class DatacatalogApiAdapter:
         TAG_TEMPLATE = "tag_template"
         ENTRY_GROUP = "entry_group"
 
-    def __init__(self) -> None:
+    _TAG_TEMPLATES_QUERIES = {
+        (True, True): (
+            f"type={ResourceType.TAG_TEMPLATE} AND "
+            "transferred=transferred AND is_public_tag_template=true"
+        ),
+        (True, False): (
+            f"type={ResourceType.TAG_TEMPLATE} AND "
+            "-transferred=transferred AND is_public_tag_template=true"
+        ),
+        (False, True): (
+            f"type={ResourceType.TAG_TEMPLATE} AND "
+            "transferred=transferred AND is_public_tag_template=false"
+        ),
+        (False, False): (
+            f"type={ResourceType.TAG_TEMPLATE} AND "
+            "-transferred=transferred AND is_public_tag_template=false"
+        ),
+    }
+
+    _ENTRY_GROUPS_QUERIES = {
+        True: f"type={ResourceType.ENTRY_GROUP} AND transferred=transferred",
+        False: f"type={ResourceType.ENTRY_GROUP} AND -transferred=transferred",
+    }
+
+    _FQN_BUILDERS = {
+        TagTemplate.__name__: TagTemplate.get_old_fqn,
+        EntryGroup.__name__: EntryGroup.get_old_fqn,
+    }
+
+    # Transient search errors are retried with exponential backoff, and
+    # a single slow page is cut off instead of stalling the whole scan.
+    SEARCH_RETRY = retries.Retry(
+        initial=0.5, maximum=8.0, multiplier=2.0, timeout=60.0
+    )
+    SEARCH_TIMEOUT = 30.0
+
+    # Maximum page size accepted by SearchCatalog.
+    PAGE_SIZE = 1000
+
+    # Number of projects searched by a single request of the bulk searches.
+    SCOPE_CHUNK_SIZE = 50
+
+    # Maximum number of resources kept by the get_* caches, and how long,
+    # in seconds, a cached resource is served. The transfer status of a
+    # resource is changed by other services, so entries must expire.
+    RESOURCE_CACHE_SIZE = 4096
+    RESOURCE_CACHE_TTL = 300
+
+    # Maximum number of known-missing resources remembered by the adapter.
+    MISSING_CACHE_SIZE = 10_000
+
+    def __init__(
+        self,
+        max_workers: int = 32,
+        limiter: TokenBucket | None = None,
+        search_retry: retries.Retry = SEARCH_RETRY,
+        search_timeout: float = SEARCH_TIMEOUT,
+        admin_search: bool = True,
+        quota_project: str | None = None,
+    ) -> None:
         """
         Initializes the DataCatalogApiAdapter with a Data Catalog client.
-        """
-        self._client = datacatalog.DataCatalogClient(
-            client_info=ClientInfo(
-                user_agent="TransferTooling/1.0.0"
-            ),
+        max_workers bounds the number of concurrent requests issued by the
+        bulk methods. If a limiter is given, every request waits for
+        a token from it before being sent. Otherwise, if quota_project is
+        given, a limiter is created from the Data Catalog read quota of
+        that project. search_retry and search_timeout
+        apply to every search request. admin_search searches with
+        the searchAll permissions of the scope instead of the caller's own
+        permissions on each resource; it is required to find every resource
+        of an organization, but can be disabled for callers that only need
+        resources they can read.
+        """
+        self._client = get_data_catalog_client()
+        self._search_retry = search_retry
+        self._search_timeout = search_timeout
+        self._admin_search = admin_search
+        self._max_workers = max_workers
+        if limiter is None and quota_project is not None:
+            limiter = QuotaInfoAdapter().create_rate_limiter(
+                quota_project,
+                Services.DATA_CATALOG,
+                Quotas.DATA_CATALOG_READ_REQUESTS,
+            )
+        self._limiter = limiter or nullcontext()
+        self._missing: OrderedDict[str, None] = OrderedDict()
+        self._missing_lock = Lock()
+        self._entry_group_cache: TTLCache[str, EntryGroupProto] = TTLCache(
+            maxsize=self.RESOURCE_CACHE_SIZE, ttl=self.RESOURCE_CACHE_TTL
+        )
+        self._tag_template_cache: TTLCache[str, TagTemplateType] = TTLCache(
+            maxsize=self.RESOURCE_CACHE_SIZE, ttl=self.RESOURCE_CACHE_TTL
         )
+        self._cache_lock = Lock()
+        self._cache_generation = 0
         self._logger = get_logger()
 
     def _search_all(
         self,
         scope: list[str],
         query: str,
-        page_size: int = 500,
+        page_size: int = PAGE_SIZE,
         next_page_token = None,
+        order_by: str = "default",
     ) -> SearchCatalogPager:
         """
         Performs a search in the Data Catalog with the
-        specified scope and query.
+        specified scope and query. Results are ordered by order_by; the
+        default ordering keeps page tokens stable, so paging through the
+        results neither skips nor repeats resources.
         """
         request = {
             "scope": {"include_project_ids": scope},
             "query": query,
-            "admin_search": True,
-            "order_by": "default",
+            "admin_search": self._admin_search,
             "page_size": page_size,
             "page_token": next_page_token,
+            "order_by": order_by,
         }
 
-        return self._client.search_catalog(request=request)
+        with self._limiter:
+            return self._client.search_catalog(
+                request=request,
+                retry=self._search_retry,
+                timeout=self._search_timeout,
+            )
 
     def _search_page(
         self,
         scope: list[str],
         query: str,
-        page_size: int = 500,
+        page_size: int = PAGE_SIZE,
         next_page_token = None,
+        order_by: str = "default",
     ) -> SearchCatalogResponse:
         """
         Performs a search in the Data Catalog with the
         specified scope and query.
         """
         return next(
-            self._search_all(scope, query, page_size, next_page_token).pages
+            self._search_all(
+                scope, query, page_size, next_page_token, order_by
+            ).pages
         )
 
+    def _search_pages(
+        self, scope: list[str], query: str, page_size: int = PAGE_SIZE
+    ) -> Iterator[SearchCatalogResponse]:
+        """
+        Yields the search result pages one by one. Pages are chained by
+        their page tokens, so at most one page is prefetched ahead of
+        the caller.
+        """
+        page = self._search_page(scope, query, page_size)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while page.next_page_token:
+                next_page = executor.submit(
+                    self._search_page,
+                    scope,
+                    query,
+                    page_size,
+                    page.next_page_token,
+                )
+                yield page
+                page = next_page.result()
+
+        yield page
+
     def search_tag_templates(
         self,
         projects: list[str],
         public: bool,
         transferred: bool,
-        page_size: int = 500,
+        page_size: int = PAGE_SIZE,
         page_token: str = None,
+        order_by: str = "default",
     ) -> tuple[list[TagTemplate], str]:
         """
         This method constructs a query to find tag templates based on their
         public visibility and whether they have been marked as transferred.
         It executes the search across the provided list of project IDs.
         """
-        transferred_query = (
-            "transferred=transferred"
-            if transferred
-            else "-transferred=transferred"
-        )
-        public_query = "is_public_tag_template=" + (
-            "true" if public else "false"
-        )
-        query = (
-            f"type={self.ResourceType.TAG_TEMPLATE} AND "
-            f"{transferred_query} AND "
-            f"{public_query}"
+        if not projects:
+            return [], None
+
+        query = self._tag_templates_query(public, transferred)
+        result = self._search_page(
+            projects, query, page_size, page_token, order_by
         )
-        result = self._search_page(projects, query, page_size, page_token)
+
+        to_tag_template = TagTemplate.proto_to_tag_template
 
         return (
-            list(
-                map(
-                    lambda msg: TagTemplate.proto_to_tag_template(
-                        msg, public, transferred
-                    ),
-                    result.results,
-                )
-            ),
+            [
+                to_tag_template(msg, public, transferred)
+                for msg in result.results
+            ],
             result.next_page_token,
         )
 
@@ -145,77 +270,334 @@ class DatacatalogApiAdapter:
         self,
         projects: list[str],
         transferred: bool,
-        page_size: int = 500,
+        page_size: int = PAGE_SIZE,
         page_token: str = None,
+        order_by: str = "default",
     ) -> tuple[list[EntryGroup], str]:
         """
         This method constructs a query to find entry groups based on whether
         they have been marked as transferred. It then executes the search across
         the provided list of project IDs.
         """
-        transferred_query = (
-            "transferred=transferred"
-            if transferred
-            else "-transferred=transferred"
+        if not projects:
+            return [], None
+
+        query = self._entry_groups_query(transferred)
+        result = self._search_page(
+            projects, query, page_size, page_token, order_by
         )
-        query = f"type={self.ResourceType.ENTRY_GROUP} AND {transferred_query}"
-        result = self._search_page(projects, query, page_size, page_token)
+
+        to_entry_group = EntryGroup.proto_to_entry_group
 
         return (
-            list(
-                map(
-                    lambda msg: EntryGroup.proto_to_entry_group(
-                        msg, transferred
-                    ),
-                    result.results,
-                )
-            ),
+            [to_entry_group(msg, transferred) for msg in result.results],
             result.next_page_token,
         )
 
+    def iter_tag_templates(
+        self,
+        projects: list[str],
+        public: bool,
+        transferred: bool,
+        page_size: int = PAGE_SIZE,
+    ) -> Iterator[TagTemplate]:
+        """
+        Yields all tag templates matching the given visibility and transfer
+        status. The next page is requested in the background while
+        the caller processes the current one.
+        """
+        if not projects:
+            return
+
+        query = self._tag_templates_query(public, transferred)
+        to_tag_template = TagTemplate.proto_to_tag_template
+
+        for page in self._search_pages(projects, query, page_size):
+            yield from (
+                to_tag_template(msg, public, transferred)
+                for msg in page.results
+            )
+
+    def iter_entry_groups(
+        self,
+        projects: list[str],
+        transferred: bool,
+        page_size: int = PAGE_SIZE,
+    ) -> Iterator[EntryGroup]:
+        """
+        Yields all entry groups matching the given transfer status. The next
+        page is requested in the background while the caller processes
+        the current one.
+        """
+        if not projects:
+            return
+
+        query = self._entry_groups_query(transferred)
+        to_entry_group = EntryGroup.proto_to_entry_group
+
+        for page in self._search_pages(projects, query, page_size):
+            yield from (
+                to_entry_group(msg, transferred) for msg in page.results
+            )
+
+    def search_all_tag_templates(
+        self,
+        projects: list[str],
+        public: bool,
+        transferred: bool,
+        chunk_size: int = SCOPE_CHUNK_SIZE,
+    ) -> list[TagTemplate]:
+        """
+        Retrieves all tag templates of the given projects. Projects are
+        split into chunks searched concurrently, each one page by page.
+        """
+        results = self._fan_out(
+            lambda chunk: list(
+                self.iter_tag_templates(chunk, public, transferred)
+            ),
+            self._scope_chunks(projects, chunk_size),
+        )
+        return [tag_template for chunk in results for tag_template in chunk]
+
+    def search_all_entry_groups(
+        self,
+        projects: list[str],
+        transferred: bool,
+        chunk_size: int = SCOPE_CHUNK_SIZE,
+    ) -> list[EntryGroup]:
+        """
+        Retrieves all entry groups of the given projects. Projects are
+        split into chunks searched concurrently, each one page by page.
+        """
+        results = self._fan_out(
+            lambda chunk: list(self.iter_entry_groups(chunk, transferred)),
+            self._scope_chunks(projects, chunk_size),
+        )
+        return [entry_group for chunk in results for entry_group in chunk]
+
+    @staticmethod
+    def _scope_chunks(
+        projects: list[str], chunk_size: int
+    ) -> list[tuple[list[str]]]:
+        """
+        Splits deduplicated project IDs into search scopes of at most
+        chunk_size projects, so that no resource is returned twice.
+        """
+        unique = list(dict.fromkeys(projects))
+        return [
+            (unique[i : i + chunk_size],)
+            for i in range(0, len(unique), chunk_size)
+        ]
+
+    def _tag_templates_query(self, public: bool, transferred: bool) -> str:
+        """
+        Returns the precomputed search query for tag templates.
+        """
+        return self._TAG_TEMPLATES_QUERIES[(public, transferred)]
+
+    def _entry_groups_query(self, transferred: bool) -> str:
+        """
+        Returns the precomputed search query for entry groups.
+        """
+        return self._ENTRY_GROUPS_QUERIES[transferred]
+
     def get_entry_group(
-        self, project: str, location: str, name: str
+        self, project: str, location: str, name: str, use_cache: bool = True
     ) -> EntryGroupProto:
         """
-        Retrieves an entry group by its fully qualified name.
+        Retrieves an entry group by its fully qualified name. Responses are
+        cached for RESOURCE_CACHE_TTL seconds, or until the adapter updates
+        or deletes an entry group. Callers acting on the transfer status pass
+        use_cache=False to read the current state.
         """
         fqn = EntryGroup.get_old_fqn(project, location, name)
-        return self._client.get_entry_group(request={"name": fqn})
+        if not use_cache:
+            return self._fetch_entry_group(fqn)
+        return self._get_cached(
+            self._entry_group_cache, self._fetch_entry_group, fqn
+        )
 
     def get_tag_template(
-        self, project: str, location: str, name: str
+        self, project: str, location: str, name: str, use_cache: bool = True
     ) -> TagTemplateType:
         """
-        Retrieves a tag template by its fully qualified name.
+        Retrieves a tag template by its fully qualified name. Responses are
+        cached for RESOURCE_CACHE_TTL seconds, or until the adapter updates
+        or deletes a tag template. Callers acting on the transfer status pass
+        use_cache=False to read the current state.
         """
         fqn = TagTemplate.get_old_fqn(project, location, name)
-        return self._client.get_tag_template(request={"name": fqn})
+        if not use_cache:
+            return self._fetch_tag_template(fqn)
+        return self._get_cached(
+            self._tag_template_cache, self._fetch_tag_template, fqn
+        )
+
+    def _get_cached(
+        self, cache: TTLCache, fetch: Callable[[str], Any], fqn: str
+    ) -> Any:
+        """
+        Returns the cached resource, fetching and caching it on a miss.
+        Errors such as NotFound propagate and are not cached. A fetch that
+        overlaps a cache clear is not stored, since it may predate the
+        change that cleared the cache.
+        """
+        with self._cache_lock:
+            resource = cache.get(fqn)
+            generation = self._cache_generation
+        if resource is None:
+            resource = fetch(fqn)
+            with self._cache_lock:
+                if generation == self._cache_generation:
+                    cache[fqn] = resource
+        return resource
+
+    def _clear_cache(self, cache: TTLCache) -> None:
+        """
+        Drops every resource of a cache after the adapter changed one.
+        """
+        with self._cache_lock:
+            cache.clear()
+            self._cache_generation += 1
+
+    def _fetch_entry_group(self, fqn: str) -> EntryGroupProto:
+        """
+        Requests an entry group from the API, bypassing the cache.
+        """
+        with self._limiter:
+            return self._client.get_entry_group(request={"name": fqn})
+
+    def _fetch_tag_template(self, fqn: str) -> TagTemplateType:
+        """
+        Requests a tag template from the API, bypassing the cache.
+        """
+        with self._limiter:
+            return self._client.get_tag_template(request={"name": fqn})
+
+    def clear_cache(self) -> None:
+        """
+        Drops all cached entry groups and tag templates.
+        """
+        self._clear_cache(self._entry_group_cache)
+        self._clear_cache(self._tag_template_cache)
 
     def get_resource_policy(
         self, resource_type: str, project: str, location: str, name: str
-    ) -> list:
+    ) -> list[Binding]:
         """
         Retrieves the IAM policy for a resource.
         """
-        if resource_type == TagTemplate.__name__:
-            fqn = TagTemplate.get_old_fqn(project, location, name)
-        elif resource_type == EntryGroup.__name__:
-            fqn = EntryGroup.get_old_fqn(project, location, name)
-        else:
+        get_fqn = self._FQN_BUILDERS.get(resource_type)
+        if get_fqn is None:
             raise IncorrectTypeException(
                 f"Unknown resource type: {resource_type}"
             )
 
+        fqn = get_fqn(project, location, name)
+
+        if self._is_missing(fqn):
+            return []
+
         try:
-            response = self._client.get_iam_policy(resource=fqn)
+            with self._limiter:
+                response = self._client.get_iam_policy(resource=fqn)
         except NotFound:
+            self._mark_missing(fqn)
             return []
 
         return [
-            {"role": binding.role, "members": binding.members}
+            Binding(binding.role, tuple(binding.members))
             for binding in response.bindings
         ]
 
+    def _is_missing(self, fqn: str) -> bool:
+        """
+        Checks whether the resource was already reported as not found.
+        """
+        with self._missing_lock:
+            if fqn not in self._missing:
+                return False
+            self._missing.move_to_end(fqn)
+            return True
+
+    def _mark_missing(self, fqn: str) -> None:
+        """
+        Remembers a resource reported as not found, evicting the least
+        recently used entry once the cache is full.
+        """
+        with self._missing_lock:
+            self._missing[fqn] = None
+            self._missing.move_to_end(fqn)
+            if len(self._missing) > self.MISSING_CACHE_SIZE:
+                self._missing.popitem(last=False)
+
+    def get_entry_groups(
+        self, resources: list[tuple[str, str, str]]
+    ) -> list[EntryGroupProto | None]:
+        """
+        Retrieves multiple entry groups concurrently. Each resource is a
+        (project, location, name) tuple; results keep the input order and
+        missing entry groups are returned as None.
+        """
+        return self._fan_out(
+            lambda *resource: self._get_or_none(
+                self.get_entry_group, *resource
+            ),
+            resources,
+        )
+
+    def get_tag_templates(
+        self, resources: list[tuple[str, str, str]]
+    ) -> list[TagTemplateType | None]:
+        """
+        Retrieves multiple tag templates concurrently. Each resource is a
+        (project, location, name) tuple; results keep the input order and
+        missing tag templates are returned as None.
+        """
+        return self._fan_out(
+            lambda *resource: self._get_or_none(
+                self.get_tag_template, *resource
+            ),
+            resources,
+        )
+
+    def get_resource_policies(
+        self, resource_type: str, resources: list[tuple[str, str, str]]
+    ) -> list[list[Binding]]:
+        """
+        Retrieves the IAM policies for multiple resources of the same type
+        concurrently. Each resource is a (project, location, name) tuple;
+        results keep the input order.
+        """
+        return self._fan_out(
+            lambda *resource: self.get_resource_policy(
+                resource_type, *resource
+            ),
+            resources,
+        )
+
+    @staticmethod
+    def _get_or_none(func: Callable[..., Any], *args: str) -> Any | None:
+        """
+        Calls a getter, returning None if the resource doesn't exist, so
+        that a single missing resource doesn't fail a whole batch.
+        """
+        try:
+            return func(*args)
+        except NotFound:
+            return None
+
+    def _fan_out(
+        self,
+        func: Callable[..., Any],
+        resources: list[tuple[str, ...]],
+    ) -> list[Any]:
+        """
+        Calls func for every tuple of arguments concurrently, bounded by
+        the adapter's max_workers. Results keep the input order.
+        """
+        return fan_out(func, resources, self._max_workers)
+
     def transfer_tag_template(
         self, fqn: str
     ) -> TagTemplateType | GoogleAPIError:
@@ -245,6 +627,28 @@ class DatacatalogApiAdapter:
 
         return self._update_entry_group(entry_group, "transferredToDataplex")
 
+    def transfer_tag_templates(
+        self, fqns: list[str]
+    ) -> list[TagTemplateType | GoogleAPIError]:
+        """
+        Transfers multiple tag templates concurrently. Failed updates are
+        logged and returned as errors in place of the tag template.
+        """
+        return self._fan_out(
+            self.transfer_tag_template, [(fqn,) for fqn in fqns]
+        )
+
+    def transfer_entry_groups(
+        self, fqns: list[str]
+    ) -> list[EntryGroupProto | GoogleAPIError]:
+        """
+        Transfers multiple entry groups concurrently. Failed updates are
+        logged and returned as errors in place of the entry group.
+        """
+        return self._fan_out(
+            self.transfer_entry_group, [(fqn,) for fqn in fqns]
+        )
+
     def _update_tag_template(
         self, tag_template: tags.TagTemplate, update_mask: str
     ) -> TagTemplateType | GoogleAPIError:
@@ -252,10 +656,12 @@ class DatacatalogApiAdapter:
         Update TagTemplate
         """
         try:
-            response = self._client.update_tag_template(
-                tag_template=tag_template,
-                update_mask=update_mask,
-            )
+            with self._limiter:
+                response = self._client.update_tag_template(
+                    tag_template=tag_template,
+                    update_mask=update_mask,
+                )
+            self._clear_cache(self._tag_template_cache)
             return response
         except GoogleAPIError as e:
             self._logger.error(
@@ -270,10 +676,12 @@ class DatacatalogApiAdapter:
         Update EntryGroup
         """
         try:
-            response = self._client.update_entry_group(
-                entry_group=entry_group,
-                update_mask=update_mask,
-            )
+            with self._limiter:
+                response = self._client.update_entry_group(
+                    entry_group=entry_group,
+                    update_mask=update_mask,
+                )
+            self._clear_cache(self._entry_group_cache)
             return response
         except GoogleAPIError as e:
             self._logger.error(
@@ -293,7 +701,9 @@ class DatacatalogApiAdapter:
             "update_mask": "isPubliclyReadable",
         })
 
-        response = self._client.update_tag_template(request=request)
+        with self._limiter:
+            response = self._client.update_tag_template(request=request)
+        self._clear_cache(self._tag_template_cache)
         return response
 
     def create_entry_group(
@@ -302,10 +712,11 @@ class DatacatalogApiAdapter:
         """
         Creates an entry group.
         """
-        self._client.create_entry_group(
-            parent=f"projects/{project}/locations/{location}",
-            entry_group_id=name,
-        )
+        with self._limiter:
+            self._client.create_entry_group(
+                parent=f"projects/{project}/locations/{location}",
+                entry_group_id=name,
+            )
 
     def create_tag_template(
         self,
@@ -324,11 +735,12 @@ class DatacatalogApiAdapter:
                 "fields": fields,
             }
         )
-        self._client.create_tag_template(
-            parent=f"projects/{project}/locations/{location}",
-            tag_template_id=name,
-            tag_template=tag_template,
-        )
+        with self._limiter:
+            self._client.create_tag_template(
+                parent=f"projects/{project}/locations/{location}",
+                tag_template_id=name,
+                tag_template=tag_template,
+            )
 
     def delete_entry_group(
         self, project: str, location: str, name: str, force: bool = False
@@ -336,12 +748,14 @@ class DatacatalogApiAdapter:
         """
         Deletes an entry group.
         """
-        self._client.delete_entry_group(
-            request=DeleteEntryGroupRequest({
-                "name": EntryGroup.get_old_fqn(project, location, name),
-                "force": force,
-            })
-        )
+        with self._limiter:
+            self._client.delete_entry_group(
+                request=DeleteEntryGroupRequest({
+                    "name": EntryGroup.get_old_fqn(project, location, name),
+                    "force": force,
+                })
+            )
+        self._clear_cache(self._entry_group_cache)
 
     def delete_tag_template(
         self, project: str, location: str, name: str, force: bool = False
@@ -349,7 +763,9 @@ class DatacatalogApiAdapter:
         """
         Deletes a tag template.
         """
-        self._client.delete_tag_template(
-            name=TagTemplate.get_old_fqn(project, location, name),
-            force=force,
-        )
+        with self._limiter:
+            self._client.delete_tag_template(
+                name=TagTemplate.get_old_fqn(project, location, name),
+                force=force,
+            )
+        self._clear_cache(self._tag_template_cache)
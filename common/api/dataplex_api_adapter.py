@@ -23,19 +23,23 @@ Classes:
 with the Data Catalog API.
 """
 
+import threading
+from typing import Callable, Iterator
+
 import google_auth_httplib2
+import httplib2
 import google.auth as auth
-import google.cloud.dataplex as dataplex
 import google.cloud.dataplex_v1.types as dataplex_types
-from google.api_core.exceptions import NotFound
-from google.api_core.gapic_v1.client_info import ClientInfo
+from google.api_core.exceptions import GoogleAPIError, NotFound
+from google.api_core.operation import Operation
 from googleapiclient import discovery
 from googleapiclient.errors import HttpError
 from googleapiclient.http import HttpRequest
 
-from common.entities import TagTemplate, EntryGroup
+from common.api.clients import USER_AGENT, get_catalog_service_client
+from common.entities import TagTemplate, EntryGroup, Binding
 from common.exceptions import IncorrectTypeException
-from common.utils import get_logger
+from common.utils import get_logger, fan_out
 
 
 class CustomRequestBuilder(HttpRequest):
@@ -61,7 +65,7 @@ class CustomRequestBuilder(HttpRequest):
         """
         if headers is None:
             headers = {}
-        headers["User-Agent"] = "TransferTooling/1.0.0"
+        headers["User-Agent"] = USER_AGENT
         super().__init__(
             http, postproc, uri, method, body, headers, methodId, resumable
         )
@@ -72,20 +76,73 @@ class DataplexApiAdapter:
     An adapter class for interacting with the Google Cloud Dataplex API.
     """
 
-    def __init__(self) -> None:
+    # Maximum page size of the list requests; larger values are coerced
+    # to the server maximum.
+    PAGE_SIZE = 1000
+
+    # Seconds the bulk deletes wait for each delete operation to finish.
+    DELETE_TIMEOUT = 300
+
+    _FQN_BUILDERS = {
+        TagTemplate.__name__: TagTemplate.get_new_fqn,
+        EntryGroup.__name__: EntryGroup.get_new_fqn,
+    }
+
+    def __init__(self, max_workers: int = 32) -> None:
         """
         Initializes the DataplexApiAdapter with a Data Catalog client.
+        max_workers bounds the number of concurrent requests issued by the
+        bulk methods.
         """
-        self._client = dataplex.CatalogServiceClient(
-            client_info=ClientInfo(user_agent="TransferTooling/1.0.0"),
-        )
+        self._client = get_catalog_service_client()
+        # Requests are executed with the authorized client of the calling
+        # thread, so the service is built without credentials.
         self._plain_client = discovery.build(
-            "dataplex", "v1", requestBuilder=CustomRequestBuilder
+            "dataplex",
+            "v1",
+            http=httplib2.Http(),
+            requestBuilder=CustomRequestBuilder,
         )
+        self._max_workers = max_workers
         self._logger = get_logger()
-        self._credentials, _ = auth.default(
-            scopes=["https://www.googleapis.com/auth/cloud-platform"]
-        )
+        self._credentials = None
+        self._refresh_lock = threading.Lock()
+        self._local = threading.local()
+
+    def _refresh_credentials(self) -> None:
+        """
+        Loads the default credentials on first use and refreshes the access
+        token once it is missing or close to expiry. Only one thread
+        refreshes it, the others reuse the new token instead of each
+        exchanging their own on the first request.
+        """
+        credentials = self._credentials
+        if credentials is not None and credentials.valid:
+            return
+
+        with self._refresh_lock:
+            if self._credentials is None:
+                self._credentials, _ = auth.default(
+                    scopes=["https://www.googleapis.com/auth/cloud-platform"]
+                )
+            if not self._credentials.valid:
+                self._credentials.refresh(
+                    google_auth_httplib2.Request(httplib2.Http())
+                )
+
+    def _http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """
+        Returns the authorized HTTP client of the calling thread. httplib2
+        connections are not thread-safe, so each thread keeps its own
+        client and reuses its open connections between calls.
+        """
+        self._refresh_credentials()
+
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self._credentials)
+            self._local.http = http
+        return http
 
     def get_entry_group(self, fqn: str) -> dataplex_types.EntryGroup | None:
         """
@@ -100,14 +157,13 @@ class DataplexApiAdapter:
         """
         Get aspect type info
         """
-        http = google_auth_httplib2.AuthorizedHttp(self._credentials)
         try:
             answer = (
                 self._plain_client.projects()
                 .locations()
                 .aspectTypes()
                 .get(name=fqn)
-                .execute(http=http)
+                .execute(http=self._http())
             )
             return answer
         except HttpError as e:
@@ -115,65 +171,151 @@ class DataplexApiAdapter:
                 return None
             raise e
 
+    def get_entry_groups(
+        self, fqns: list[str]
+    ) -> list[dataplex_types.EntryGroup | None]:
+        """
+        Retrieves multiple entry groups concurrently. Results keep the input
+        order and missing entry groups are returned as None.
+        """
+        return fan_out(
+            self.get_entry_group, [(fqn,) for fqn in fqns], self._max_workers
+        )
+
+    def get_aspect_types(self, fqns: list[str]) -> list[dict | None]:
+        """
+        Retrieves multiple aspect types concurrently. Results keep the input
+        order and missing aspect types are returned as None.
+        """
+        return fan_out(
+            self.get_aspect_type, [(fqn,) for fqn in fqns], self._max_workers
+        )
+
+    def list_entry_groups(
+        self, project: str, location: str, page_size: int = PAGE_SIZE
+    ) -> Iterator[dataplex_types.EntryGroup]:
+        """
+        Yields all entry groups of a project location. Unlike a catalog
+        search, listing needs no query, so it is the cheaper way to
+        enumerate everything in a location. Pages are requested lazily.
+        """
+        yield from self._client.list_entry_groups(
+            request={
+                "parent": f"projects/{project}/locations/{location}",
+                "page_size": page_size,
+            }
+        )
+
+    def list_aspect_types(
+        self, project: str, location: str, page_size: int = PAGE_SIZE
+    ) -> Iterator[dataplex_types.AspectType]:
+        """
+        Yields all aspect types of a project location. Pages are requested
+        lazily.
+        """
+        yield from self._client.list_aspect_types(
+            request={
+                "parent": f"projects/{project}/locations/{location}",
+                "page_size": page_size,
+            }
+        )
+
     def delete_entry_group(
         self, project: str, location: str, name: str
-    ) -> None:
+    ) -> Operation:
         """
-        Deletes an entry group.
+        Starts the deletion of an entry group.
         """
         fqn = EntryGroup.get_new_fqn(project, location, name)
-        self._client.delete_entry_group(name=fqn)
+        return self._client.delete_entry_group(name=fqn)
 
     def delete_aspect_type(
         self, project: str, location: str, name: str
-    ) -> dict | None:
+    ) -> Operation | None:
         """
-        Deletes an aspect type.
+        Starts the deletion of an aspect type.
         """
         fqn = TagTemplate.get_new_fqn(project, location, name)
-        http = google_auth_httplib2.AuthorizedHttp(self._credentials)
         try:
-            answer = (
-                self._plain_client.projects()
-                .locations()
-                .aspectTypes()
-                .delete(name=fqn)
-                .execute(http=http)
-            )
-            return answer
-        except HttpError as e:
-            if e.status_code == 404:
-                return None
-            raise e
+            return self._client.delete_aspect_type(name=fqn)
+        except NotFound:
+            return None
+
+    def delete_entry_groups(
+        self, resources: list[tuple[str, str, str]]
+    ) -> dict[str, GoogleAPIError | TimeoutError | None]:
+        """
+        Deletes multiple entry groups concurrently. Each resource is a
+        (project, location, name) tuple. Returns the error of every
+        entry group by its FQN, or None once its delete operation has
+        finished, so that callers can retry only the failed ones.
+        """
+        return self._delete_all(
+            self.delete_entry_group, EntryGroup.get_new_fqn, resources
+        )
+
+    def delete_aspect_types(
+        self, resources: list[tuple[str, str, str]]
+    ) -> dict[str, GoogleAPIError | TimeoutError | None]:
+        """
+        Deletes multiple aspect types concurrently. Each resource is a
+        (project, location, name) tuple. Returns the error of every
+        aspect type by its FQN, or None once its delete operation has
+        finished, so that callers can retry only the failed ones.
+        """
+        return self._delete_all(
+            self.delete_aspect_type, TagTemplate.get_new_fqn, resources
+        )
+
+    def _delete_all(
+        self,
+        delete: Callable[[str, str, str], Operation | None],
+        get_fqn: Callable[[str, str, str], str],
+        resources: list[tuple[str, str, str]],
+    ) -> dict[str, GoogleAPIError | TimeoutError | None]:
+        """
+        Calls delete for every resource on the worker pool and waits for
+        each delete operation to finish, collecting the error of each
+        resource instead of failing the whole batch.
+        """
+        def delete_one(*resource: str) -> GoogleAPIError | TimeoutError | None:
+            try:
+                operation = delete(*resource)
+                if operation is not None:
+                    operation.result(timeout=self.DELETE_TIMEOUT)
+            except (GoogleAPIError, TimeoutError) as e:
+                self._logger.error(
+                    "Error deleting %s. %s", get_fqn(*resource), e
+                )
+                return e
+            return None
+
+        errors = fan_out(delete_one, resources, self._max_workers)
+        return {
+            get_fqn(*resource): error
+            for resource, error in zip(resources, errors)
+        }
 
     def get_resource_policy(
         self, resource_type: str, project: str, location: str, name: str
-    ) -> list:
+    ) -> list[Binding]:
         """
         Retrieves the IAM policy bindings for a resource.
         """
-        http = google_auth_httplib2.AuthorizedHttp(self._credentials)
-        if resource_type == TagTemplate.__name__:
-            fqn = TagTemplate.get_new_fqn(project, location, name)
-            response = (
-                self._plain_client.projects()
-                .locations()
-                .aspectTypes()
-                .getIamPolicy(resource=fqn)
-                .execute(http=http)
-            )
-            return response.get("bindings", [])
-        elif resource_type == EntryGroup.__name__:
-            fqn = EntryGroup.get_new_fqn(project, location, name)
-            response = (
-                self._plain_client.projects()
-                .locations()
-                .entryGroups()
-                .getIamPolicy(resource=fqn)
-                .execute(http=http)
-            )
-            return response.get("bindings", [])
-        else:
+        get_fqn = self._FQN_BUILDERS.get(resource_type)
+        if get_fqn is None:
             raise IncorrectTypeException(
-                f"Unknown resource type " f"{resource_type}"
+                f"Unknown resource type: {resource_type}"
             )
+
+        fqn = get_fqn(project, location, name)
+
+        try:
+            response = self._client.get_iam_policy(request={"resource": fqn})
+        except NotFound:
+            return []
+
+        return [
+            Binding(binding.role, tuple(binding.members))
+            for binding in response.bindings
+        ]
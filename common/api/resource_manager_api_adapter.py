@@ -25,14 +25,19 @@ Classes:
 
 from functools import cache
 
-from google.cloud import resourcemanager
 from googleapiclient import discovery
 from googleapiclient.errors import HttpError
 
+from common.api.clients import get_projects_client
 from common.utils import get_logger
 from common.exceptions import FormatException
 from common.entities import Project
 
+_ANCESTRY_TYPES = {
+    "folder": Project.AncestryType.FOLDER,
+    "organization": Project.AncestryType.ORGANIZATION,
+}
+
 
 class ResourceManagerApiAdapter:
     """
@@ -43,7 +48,7 @@ class ResourceManagerApiAdapter:
         """
         Initializes the ResourceManagerApiAdapter with a ResourceManager client.
         """
-        self._project_client = resourcemanager.ProjectsClient()
+        self._project_client = get_projects_client()
         self._plain_api_client = discovery.build("cloudresourcemanager", "v1")
         self._logger = get_logger()
 
@@ -64,19 +69,46 @@ class ResourceManagerApiAdapter:
     def get_organization_number(self, project_id: str) -> str:
         """
         Retrieves the organization number for a given project ID.
+        The organization is the root of the ancestry, so the ancestors are
+        scanned from the top.
         """
-        ancestry = self.get_project_ancestry(project_id)
-
-        for ancestry_type, resource_id in ancestry:
-            if ancestry_type == Project.AncestryType.ORGANIZATION:
-                return resource_id
+        for item in reversed(self._fetch_ancestors(project_id)):
+            ancestor = item["resourceId"]
+            if ancestor["type"] == "organization":
+                return ancestor["id"]
 
+    @cache
     def get_project_ancestry(
         self, project_id: str
-    ) -> list[tuple[Project.AncestryType, str]]:
+    ) -> tuple[tuple[Project.AncestryType, str], ...]:
         """
         Retrieves the ancestry of a Google Cloud project, including its
-        parent folders and organization.
+        parent folders and organization. The result is cached and returned
+        as a tuple, so it can be shared safely between callers.
+        """
+        result = []
+
+        for item in self._fetch_ancestors(project_id):
+            ancestor = item["resourceId"]
+            ancestor_type = ancestor["type"]
+            ancestry_type = _ANCESTRY_TYPES.get(ancestor_type)
+
+            if ancestry_type is not None:
+                result.append((ancestry_type, ancestor["id"]))
+            elif ancestor_type != "project":
+                raise FormatException(
+                    "The parent is neither a folder, an organization, "
+                    f"nor a project: {ancestor_type}"
+                )
+
+        return tuple(result)
+
+    @cache
+    def _fetch_ancestors(self, project_id: str) -> tuple[dict, ...]:
+        """
+        Requests the raw ancestors of a project, from the project itself
+        up to its organization. The response is shared by all methods that
+        need the ancestry, so it is requested only once per project.
         """
         try:
             response = (
@@ -101,23 +133,4 @@ class ResourceManagerApiAdapter:
 
             raise e
 
-        result = []
-
-        for item in response["ancestor"]:
-            ancestor = item["resourceId"]
-
-            if ancestor["type"] == "folder":
-                result.append((Project.AncestryType.FOLDER, ancestor["id"]))
-            elif ancestor["type"] == "organization":
-                result.append(
-                    (Project.AncestryType.ORGANIZATION, ancestor["id"])
-                )
-            elif ancestor["type"] == "project":
-                pass
-            else:
-                raise FormatException(
-                    "The parent is neither a folder, an organization, "
-                    f"nor a project: {ancestor["type"]}"
-                )
-
-        return result
+        return tuple(response["ancestor"])
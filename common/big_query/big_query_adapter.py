@@ -24,12 +24,26 @@ Classes:
   and retrieving partitions.
 """
 
+import io
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Any
-
-from google.cloud import bigquery
-from google.api_core.exceptions import NotFound
+from itertools import islice
+from typing import Any, Iterable
+
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+from cachetools import TTLCache
+from google.cloud import bigquery, bigquery_storage
+from google.api_core import retry as retries
+from google.api_core.exceptions import (
+    NotFound,
+    PermissionDenied,
+    RetryError,
+)
 
 from common.exceptions import IncorrectTypeException
 from common.utils import get_logger
@@ -51,7 +65,9 @@ from common.big_query.big_query_exceptions import (
 class RowTransformer:
     """
     A utility class for transforming entities into a dictionary
-    format suitable for BigQuery insertion.
+    format suitable for BigQuery insertion. Rows only hold JSON types,
+    so they can be streamed without per-row schema conversion.
+    The rows are built by the entities themselves.
     """
 
     @classmethod
@@ -59,15 +75,9 @@ class RowTransformer:
         """
         Transforms an entity into a dictionary format based on its type.
         """
-        match entity:
-            case TagTemplate():
-                return cls.from_tag_template(entity, creation_date)
-            case EntryGroup():
-                return cls.from_entry_group(entity, creation_date)
-            case Project():
-                return cls.from_project(entity, creation_date)
-            case _:
-                raise IncorrectTypeException(f"Unknown entity type: {entity}")
+        if not isinstance(entity, (TagTemplate, EntryGroup, Project)):
+            raise IncorrectTypeException(f"Unknown entity type: {entity}")
+        return entity.to_bq_row(creation_date)
 
     @staticmethod
     def from_entry_group(
@@ -76,14 +86,7 @@ class RowTransformer:
         """
         Transforms an EntryGroup entity into a dictionary format.
         """
-        return {
-            "resourceName": entity.resource_name,
-            "projectId": entity.project_id,
-            "location": entity.location,
-            "entryGroupId": entity.id,
-            "managingSystem": entity.managing_system,
-            "createdAt": creation_date,
-        }
+        return entity.to_bq_row(creation_date)
 
     @staticmethod
     def from_tag_template(
@@ -92,29 +95,14 @@ class RowTransformer:
         """
         Transforms a TagTemplate entity into a dictionary format.
         """
-        return {
-            "resourceName": entity.resource_name,
-            "projectId": entity.project_id,
-            "location": entity.location,
-            "tagTemplateId": entity.id,
-            "isPubliclyReadable": entity.public,
-            "managingSystem": entity.managing_system,
-            "createdAt": creation_date,
-        }
+        return entity.to_bq_row(creation_date)
 
     @staticmethod
     def from_project(project: Project, creation_date: date) -> dict[str, Any]:
         """
         Transforms a Project entity into a dictionary format.
         """
-        return {
-            "projectId": project.project_id,
-            "projectNumber": project.project_number,
-            "isDataCatalogApiEnabled": project.data_catalog_api_enabled,
-            "isDataplexApiEnabled": project.dataplex_api_enabled,
-            "ancestry": project.ancestry,
-            "createdAt": creation_date,
-        }
+        return project.to_bq_row(creation_date)
 
 
 class BigQueryAdapter:
@@ -123,6 +111,12 @@ class BigQueryAdapter:
     providing methods to manage datasets and tables.
     """
 
+    # Entity writes with more rows than this use a load job.
+    BULK_LOAD_THRESHOLD = 1000
+    # Resolved tables are reused for this many seconds.
+    TABLE_CACHE_SIZE = 256
+    TABLE_CACHE_TTL = 3600
+
     def __init__(
         self,
         project: str,
@@ -131,29 +125,75 @@ class BigQueryAdapter:
         partition_column: str = "createdAt",
         retry_count: int = 5,
         retry_delay: int = 2,
+        insert_batch_size: int = 500,
+        insert_concurrency: int = 8,
+        partition_lookback_days: int | None = None,
     ) -> None:
         """
-        Initializes the BigQueryAdapter.
+        Initializes the BigQueryAdapter. Rows are streamed into tables
+        in requests of at most insert_batch_size rows, with up to
+        insert_concurrency requests in flight. If partition_lookback_days
+        is set, the latest partition is only looked up within that many
+        days.
         """
         self._project = project
         self._client = bigquery.Client(self._project)
+        self._bqstorage_client = None
+        self._bqstorage_enabled = True
+        self._bqstorage_lock = threading.Lock()
         self._dataset_location = dataset_location
         self._dataset_name = dataset_name
         self._partition_column = partition_column
         self.retry_count = retry_count
         self.retry_delay = retry_delay
+        self.insert_batch_size = insert_batch_size
+        self.insert_concurrency = insert_concurrency
+        self.partition_lookback_days = partition_lookback_days
+        self._dataset_ensured = False
+        self._table_cache: TTLCache[str, bigquery.Table] = TTLCache(
+            maxsize=self.TABLE_CACHE_SIZE, ttl=self.TABLE_CACHE_TTL
+        )
+        self._table_lock = threading.Lock()
+        self._creation_dates: dict[tuple[str, date], date] = {}
         self._logger = get_logger()
 
+    def refresh(self) -> None:
+        """
+        Drops the cached partition dates, so the next reads pick up
+        partitions written by other processes.
+        """
+        self._creation_dates.clear()
+
     def _get_target_creation_date(self, table_ref: str) -> date:
         """
         Retrieves the most recent partition date from the specified table.
+        The date is cached for the current day; writes made through
+        the adapter invalidate it.
+        """
+        cache_key = (table_ref, date.today())
+        if cache_key not in self._creation_dates:
+            self._creation_dates[cache_key] = self._query_target_creation_date(
+                table_ref
+            )
+        return self._creation_dates[cache_key]
+
+    def _query_target_creation_date(self, table_ref: str) -> date:
+        """
+        Queries the most recent partition date of the specified table.
+        With a partition lookback, only the partitions of the last
+        partition_lookback_days days are scanned.
         """
+        lower_bound = self._lookback_condition(self._partition_column)
         last_date_response = self._client.query(
             f"""
             SELECT max({self._partition_column}) as max_date
             FROM `{table_ref}`
             WHERE {self._partition_column} <= CURRENT_DATE()
-            """
+            {lower_bound}
+            """,
+            job_config=bigquery.QueryJobConfig(
+                query_parameters=self._lookback_parameters()
+            ),
         ).result()
 
         target_creation_date = next(last_date_response).max_date
@@ -172,6 +212,31 @@ class BigQueryAdapter:
 
         return target_creation_date
 
+    def _lookback_condition(self, partition_column: str) -> str:
+        """
+        Returns the condition limiting a partition lookup to the last
+        partition_lookback_days days, or an empty string without
+        a lookback. The condition reads the @lookback_days parameter.
+        """
+        if self.partition_lookback_days is None:
+            return ""
+        return (
+            f"AND {partition_column} >= "
+            "DATE_SUB(CURRENT_DATE(), INTERVAL @lookback_days DAY)"
+        )
+
+    def _lookback_parameters(self) -> list[bigquery.ScalarQueryParameter]:
+        """
+        Returns the query parameters of the lookback condition.
+        """
+        if self.partition_lookback_days is None:
+            return []
+        return [
+            bigquery.ScalarQueryParameter(
+                "lookback_days", "INT64", self.partition_lookback_days
+            )
+        ]
+
     def _select_data_from_partition(
         self, table_ref: str, target_creation_date: date, fields: str = "*"
     ) -> bigquery.QueryJob:
@@ -216,20 +281,18 @@ class BigQueryAdapter:
                     AND dataplexResourceName IS NULL
                 """
 
-        query_result = self._client.query(query).result()
+        columns = self._fetch_table(query)
 
-        entry_groups = [
-            EntryGroup(
-                eg.projectId,
-                eg.location,
-                eg.entryGroupId,
-                True if eg.managingSystem == ManagingSystem.DATAPLEX else False,
+        return [
+            EntryGroup(*fields)
+            for fields in zip(
+                columns["projectId"].to_pylist(),
+                columns["location"].to_pylist(),
+                columns["entryGroupId"].to_pylist(),
+                self._is_dataplex(columns).to_pylist(),
             )
-            for eg in query_result
         ]
 
-        return entry_groups
-
     def select_tag_templates(self) -> list[TagTemplate]:
         """
         Retrieves a list of tag templates from BigQuery view.
@@ -249,74 +312,41 @@ class BigQueryAdapter:
                     AND isPubliclyReadable = TRUE
                 """
 
-        query_result = self._client.query(query).result()
+        columns = self._fetch_table(query)
 
-        tag_templates = [
-            TagTemplate(
-                tt.projectId,
-                tt.location,
-                tt.tagTemplateId,
-                tt.isPubliclyReadable,
-                True if tt.managingSystem == ManagingSystem.DATAPLEX else False,
+        return [
+            TagTemplate(*fields)
+            for fields in zip(
+                columns["projectId"].to_pylist(),
+                columns["location"].to_pylist(),
+                columns["tagTemplateId"].to_pylist(),
+                columns["isPubliclyReadable"].to_pylist(),
+                self._is_dataplex(columns).to_pylist(),
             )
-            for tt in query_result
         ]
 
-        return tag_templates
-
     def get_private_tag_templates(self, scope: dict) -> list["TagTemplate"]:
         """
         Retrieves private tag templates from BigQuery based on the
         provided scope.
         """
-        tt_table_ref = self._get_table_ref(TableNames.TAG_TEMPLATES)
-        projects_table_ref = self._get_table_ref(TableNames.PROJECTS)
-
-        target_creation_date_for_tt = self._get_target_creation_date(
-            tt_table_ref
-        )
-        target_creation_date_for_projects = self._get_target_creation_date(
-            projects_table_ref
+        rows, _ = self._select_within_scope(
+            self._get_table_ref(TableNames.TAG_TEMPLATES),
+            "resourceName",
+            "resources.isPubliclyReadable = FALSE",
+            scope,
         )
 
-        query = f"""
-            DECLARE scope_type STRING; 
-            SET scope_type = \"{scope["scope_type"]}\";
-
-            SELECT DISTINCT
-                resourceName
-            FROM 
-                `{tt_table_ref}` AS tag_templates
-            JOIN 
-                `{projects_table_ref}` AS projects
-            ON 
-                tag_templates.projectId = projects.projectId,
-            UNNEST(projects.ancestry) AS ancestryItem
-            WHERE 
-                tag_templates.createdAt = \"{target_creation_date_for_tt}\"
-                AND projects.createdAt = \"{target_creation_date_for_projects}\"
-                AND tag_templates.isPubliclyReadable = FALSE
-                AND (
-                    (scope_type IN ("FOLDER", "ORGANIZATION")
-                    AND ancestryItem.type = \"{scope["scope_type"]}\"
-                    AND ancestryItem.id = \"{scope["scope_id"]}\")
-                    OR (scope_type = "PROJECT" 
-                    AND projects.projectNumber = {scope["scope_id"]})
-                )
-        """
-
-        query_result = self._client.query(query).result()
-
-        if not query_result:
+        if not rows:
             self._logger.info("Query returned no results.")
             return []
 
         private_tag_templates = []
 
-        for tt in query_result:
+        for tt in rows:
             try:
                 parse_resource_name = TagTemplate.parse_tag_template_resource(
-                    tt.resourceName
+                    tt["resourceName"]
                 )
 
                 private_tag_templates.append(
@@ -346,70 +376,36 @@ class BigQueryAdapter:
 
         Fetch entry groups matching scope criteria.
         """
-        eg_table_ref = self._get_table_ref(ViewNames.ENTRY_GROUPS_VIEW)
-        projects_table_ref = self._get_table_ref(TableNames.PROJECTS)
-
-        target_creation_date_for_eg = self._get_target_creation_date(
-            eg_table_ref
-        )
-        target_creation_date_for_projects = self._get_target_creation_date(
-            projects_table_ref
-        )
-        query = f"""
-            DECLARE scope_type STRING; 
-            SET scope_type = \"{scope["scope_type"]}\";
-
-            SELECT DISTINCT
-                resourceName as dataCatalogResourceName,
-                dataplexResourceName,
-                managingSystem
-            FROM 
-                `{eg_table_ref}` AS entry_groups
-            JOIN 
-                `{projects_table_ref}` AS projects
-            ON 
-                entry_groups.projectId = projects.projectId,
-            UNNEST(projects.ancestry) AS ancestryItem
-            WHERE 
-                entry_groups.createdAt = \"{target_creation_date_for_eg}\"
-                AND projects.createdAt = \"{target_creation_date_for_projects}\"
-                AND dataplexResourceName IS NOT NULL
-                AND entry_groups.managingSystem IN 
-                    ({",".join([f"\"{v}\"" for v in select_managing_systems])})
-                AND (
-                    (
-                        scope_type IN ("FOLDER", "ORGANIZATION")
-                        AND ancestryItem.type = \"{scope["scope_type"]}\"
-                        AND ancestryItem.id = \"{scope["scope_id"]}\"
-                    )
-                    OR 
-                    (
-                        scope_type = "PROJECT" 
-                        AND projects.projectNumber = {scope["scope_id"]}
-                    )
+        rows, target_creation_date_for_eg = self._select_within_scope(
+            self._get_table_ref(ViewNames.ENTRY_GROUPS_VIEW),
+            f"""
+                CASE COALESCE(
+                    @resource_managing_system, resources.managingSystem
                 )
+                    WHEN "{ManagingSystem.DATAPLEX}"
+                    THEN dataplexResourceName
+                    ELSE resourceName
+                END AS resourceName
+            """,
             """
+                dataplexResourceName IS NOT NULL
+                AND resources.managingSystem IN UNNEST(@managing_systems)
+            """,
+            scope,
+            select_managing_systems,
+            resource_managing_system,
+        )
 
-        query_result = self._client.query(query).result()
-
-        if not query_result:
+        if not rows:
             self._logger.info("Query returned no results.")
             return [], target_creation_date_for_eg
 
         entry_groups = []
 
-        for eg in query_result:
+        for eg in rows:
             try:
-                managing_system = resource_managing_system or eg.managingSystem
-
-                match managing_system:
-                    case ManagingSystem.DATA_CATALOG:
-                        resource_name = eg.dataCatalogResourceName
-                    case ManagingSystem.DATAPLEX:
-                        resource_name = eg.dataplexResourceName
-
                 parse_resource_name = EntryGroup.parse_entry_group_resource(
-                    resource_name
+                    eg["resourceName"]
                 )
 
                 entry_groups.append(
@@ -417,11 +413,7 @@ class BigQueryAdapter:
                         project_id=parse_resource_name["project_id"],
                         location=parse_resource_name["location"],
                         entry_group_id=parse_resource_name["entry_group_id"],
-                        transferred=(
-                            True
-                            if eg.managingSystem == ManagingSystem.DATAPLEX
-                            else False
-                        ),
+                        transferred=eg["transferred"],
                     )
                 )
             except Exception as e:
@@ -439,91 +431,245 @@ class BigQueryAdapter:
         """
         Fetch tag templates matching scope criteria.
         """
-        tt_table_ref = self._get_table_ref(ViewNames.TAG_TEMPLATES_VIEW)
-        projects_table_ref = self._get_table_ref(TableNames.PROJECTS)
-
-        target_creation_date_for_tt = self._get_target_creation_date(
-            tt_table_ref
-        )
-        target_creation_date_for_projects = self._get_target_creation_date(
-            projects_table_ref
+        rows, target_creation_date_for_tt = self._select_within_scope(
+            self._get_table_ref(ViewNames.TAG_TEMPLATES_VIEW),
+            f"""
+                CASE COALESCE(
+                    @resource_managing_system, resources.managingSystem
+                )
+                    WHEN "{ManagingSystem.DATAPLEX}"
+                    THEN dataplexResourceName
+                    ELSE resourceName
+                END AS resourceName,
+                isPubliclyReadable
+            """,
+            """
+                dataplexResourceName IS NOT NULL
+                AND resources.managingSystem IN UNNEST(@managing_systems)
+            """,
+            scope,
+            select_managing_systems,
+            resource_managing_system,
         )
-        query = f"""
-            DECLARE scope_type STRING; 
-            SET scope_type = \"{scope["scope_type"]}\";
 
+        if not rows:
+            self._logger.info("Query returned no results.")
+            return [], target_creation_date_for_tt
+
+        tag_templates = []
+
+        for tt in rows:
+            try:
+                parse_resource_name = TagTemplate.parse_tag_template_resource(
+                    tt["resourceName"]
+                )
+
+                tag_templates.append(
+                    TagTemplate(
+                        project_id=parse_resource_name["project_id"],
+                        location=parse_resource_name["location"],
+                        tag_template_id=parse_resource_name["tag_template_id"],
+                        public=tt["isPubliclyReadable"],
+                        transferred=tt["transferred"],
+                    )
+                )
+            except Exception as e:
+                self._logger.error("Error processing entry group %s: %s", tt, e)
+                continue
+
+        return tag_templates, target_creation_date_for_tt
+
+    def _select_within_scope(
+        self,
+        table_ref: str,
+        columns: str,
+        condition: str,
+        scope: dict,
+        managing_systems: list | None = None,
+        resource_managing_system: str | None = None,
+    ) -> tuple[list[dict[str, Any]], date]:
+        """
+        Selects the columns of the latest partition of a resources table
+        for the projects within the scope. The latest partitions of both
+        the resources and the projects tables are resolved in the same
+        query, together with the selection, and only within the partition
+        lookback. Every row also tells whether the resource is already
+        transferred to Dataplex. Returns the rows and the date of
+        the selected resources partition.
+        """
+        projects_table_ref = self._get_table_ref(TableNames.PROJECTS)
+        resources_column = self._partition_column
+        projects_column = SchemaProvider().get_table_metadata(
+            TableNames.PROJECTS
+        )["partition_column"]
+        query = f"""
+            WITH
+                resources_partition AS (
+                    SELECT max({resources_column}) AS partitionDate
+                    FROM `{table_ref}`
+                    WHERE {resources_column} <= CURRENT_DATE()
+                    {self._lookback_condition(resources_column)}
+                ),
+                projects_partition AS (
+                    SELECT max({projects_column}) AS partitionDate
+                    FROM `{projects_table_ref}`
+                    WHERE {projects_column} <= CURRENT_DATE()
+                    {self._lookback_condition(projects_column)}
+                )
             SELECT DISTINCT
-                resourceName as dataCatalogResourceName, 
-                dataplexResourceName,
-                isPubliclyReadable,
-                managingSystem
+                {columns},
+                resources.managingSystem = "{ManagingSystem.DATAPLEX}"
+                    AS transferred,
+                resources_partition.partitionDate AS targetCreationDate
             FROM 
-                `{tt_table_ref}` AS tag_templates
+                `{table_ref}` AS resources
+            JOIN
+                resources_partition
+            ON
+                resources.{resources_column}
+                    = resources_partition.partitionDate
             JOIN 
                 `{projects_table_ref}` AS projects
             ON 
-                tag_templates.projectId = projects.projectId,
-            UNNEST(projects.ancestry) AS ancestryItem
+                resources.projectId = projects.projectId
+            JOIN
+                projects_partition
+            ON
+                projects.{projects_column} = projects_partition.partitionDate
             WHERE 
-                tag_templates.createdAt = \"{target_creation_date_for_tt}\"
-                AND projects.createdAt = \"{target_creation_date_for_projects}\"
-                AND dataplexResourceName IS NOT NULL
-                AND tag_templates.managingSystem IN 
-                    ({",".join([f"\"{v}\"" for v in select_managing_systems])})
+                {condition}
                 AND (
                     (
-                        scope_type IN ("FOLDER", "ORGANIZATION")
-                        AND ancestryItem.type = \"{scope["scope_type"]}\"
-                        AND ancestryItem.id = \"{scope["scope_id"]}\"
+                        @scope_type IN ("FOLDER", "ORGANIZATION")
+                        AND EXISTS (
+                            SELECT 1
+                            FROM UNNEST(projects.ancestry) AS ancestryItem
+                            WHERE ancestryItem.type = @scope_type
+                            AND ancestryItem.id = @scope_id
+                        )
                     )
                     OR 
                     (
-                        scope_type = "PROJECT" 
-                        AND projects.projectNumber = {scope["scope_id"]}
+                        @scope_type = "PROJECT" 
+                        AND projects.projectNumber
+                            = SAFE_CAST(@scope_id AS INT64)
                     )
                 )
             """
+        job_config = self._scope_query_config(
+            scope, managing_systems, resource_managing_system
+        )
+        job_config.query_parameters = [
+            *job_config.query_parameters,
+            *self._lookback_parameters(),
+        ]
+        rows = self._download(self._client.query(query, job_config=job_config))
 
-        query_result = self._client.query(query).result()
-
-        if not query_result:
-            self._logger.info("Query returned no results.")
-            return [], target_creation_date_for_tt
+        if rows:
+            return rows, rows[0]["targetCreationDate"]
 
-        tag_templates = []
+        # Without matching rows the partition dates are looked up on their
+        # own, which also reports tables that have no partition at all.
+        self._get_target_creation_date(projects_table_ref)
+        return rows, self._get_target_creation_date(table_ref)
 
-        for tt in query_result:
-            try:
-                managing_system = resource_managing_system or tt.managingSystem
+    def _fetch_table(
+        self, query: str, job_config: bigquery.QueryJobConfig | None = None
+    ) -> pa.Table:
+        """
+        Runs the query and returns its result as a columnar Arrow table.
+        """
+        return self._download_table(
+            self._client.query(query, job_config=job_config)
+        )
 
-                match managing_system:
-                    case ManagingSystem.DATA_CATALOG:
-                        resource_name = tt.dataCatalogResourceName
-                    case ManagingSystem.DATAPLEX:
-                        resource_name = tt.dataplexResourceName
+    def _download(self, query_job: bigquery.QueryJob) -> list[dict[str, Any]]:
+        """
+        Downloads the result of a query job as dictionaries.
+        """
+        return self._download_table(query_job).to_pylist()
 
-                parse_resource_name = TagTemplate.parse_tag_template_resource(
-                    resource_name
+    def _download_table(self, query_job: bigquery.QueryJob) -> pa.Table:
+        """
+        Downloads the result of a query job as an Arrow table. Results
+        larger than a single page are streamed as Arrow record batches
+        through the BigQuery Storage API instead of being paged over REST.
+        The Storage API requires the bigquery.readsessions.create
+        permission; without it, results are paged over REST.
+        """
+        if self._bqstorage_enabled:
+            try:
+                return query_job.result().to_arrow(
+                    bqstorage_client=self._get_bqstorage_client()
+                )
+            except PermissionDenied as e:
+                self._bqstorage_enabled = False
+                self._logger.warning(
+                    "BigQuery Storage API is not permitted, "
+                    "falling back to REST downloads. %s",
+                    e,
                 )
 
-                tag_templates.append(
-                    TagTemplate(
-                        project_id=parse_resource_name["project_id"],
-                        location=parse_resource_name["location"],
-                        tag_template_id=parse_resource_name["tag_template_id"],
-                        public=tt.isPubliclyReadable,
-                        transferred=(
-                            True
-                            if tt.managingSystem == ManagingSystem.DATAPLEX
-                            else False
-                        ),
+        return query_job.result().to_arrow(create_bqstorage_client=False)
+
+    def _get_bqstorage_client(self) -> bigquery_storage.BigQueryReadClient:
+        """
+        Returns the BigQuery Storage client, creating it on first use.
+        """
+        if self._bqstorage_client is None:
+            with self._bqstorage_lock:
+                if self._bqstorage_client is None:
+                    self._bqstorage_client = (
+                        bigquery_storage.BigQueryReadClient()
                     )
-                )
-            except Exception as e:
-                self._logger.error("Error processing entry group %s: %s", tt, e)
-                continue
+        return self._bqstorage_client
 
-        return tag_templates, target_creation_date_for_tt
+    @staticmethod
+    def _is_dataplex(columns: pa.Table) -> pa.ChunkedArray:
+        """
+        Flags the rows managed by Dataplex, comparing the whole
+        managingSystem column at once.
+        """
+        return pc.fill_null(
+            pc.equal(columns["managingSystem"], str(ManagingSystem.DATAPLEX)),
+            False,
+        )
+
+    @staticmethod
+    def _scope_query_config(
+        scope: dict,
+        managing_systems: list | None = None,
+        resource_managing_system: str | None = None,
+    ) -> bigquery.QueryJobConfig:
+        """
+        Builds the query parameters of the scope queries. Passing values
+        as parameters keeps the query text identical between scopes, which
+        lets BigQuery serve repeated queries from its result cache.
+        The managing system parameters are only set for the queries
+        filtering on managing systems.
+        """
+        query_parameters = [
+            bigquery.ScalarQueryParameter(
+                "scope_type", "STRING", scope["scope_type"]
+            ),
+            bigquery.ScalarQueryParameter(
+                "scope_id", "STRING", str(scope["scope_id"])
+            ),
+        ]
+        if managing_systems is not None:
+            query_parameters.append(
+                bigquery.ArrayQueryParameter(
+                    "managing_systems", "STRING", list(managing_systems)
+                )
+            )
+            query_parameters.append(
+                bigquery.ScalarQueryParameter(
+                    "resource_managing_system",
+                    "STRING",
+                    resource_managing_system,
+                )
+            )
+        return bigquery.QueryJobConfig(query_parameters=query_parameters)
 
     @google_api_exception_shield
     def get_projects_to_fetch(self) -> list[str]:
@@ -538,8 +684,8 @@ class BigQueryAdapter:
         )
 
         project_ids = [
-            project_id.projectId
-            for project_id in project_ids_query_job.result()
+            project_id["projectId"]
+            for project_id in self._download(project_ids_query_job)
         ]
         return project_ids
 
@@ -557,8 +703,12 @@ class BigQueryAdapter:
 
     def ensure_dataset_exists(self) -> bigquery.Dataset:
         """
-        Retrieves the dataset, creating it if it does not exist.
+        Retrieves the dataset, creating it if it does not exist. The check
+        is done once per adapter.
         """
+        if self._dataset_ensured:
+            return
+
         dataset_ref = self._get_dataset_ref()
         try:
             self._client.get_dataset(dataset_ref)
@@ -568,17 +718,53 @@ class BigQueryAdapter:
             self._client.create_dataset(dataset)
             time.sleep(60)
 
+        self._dataset_ensured = True
+
     @google_api_exception_shield
     def create_table_if_not_exists(
         self, table_ref: bigquery.TableReference | str
     ) -> bigquery.Table:
         """
         Creates a table in the dataset with the specified name,
-        using schema information from a SchemaProvider.
+        using schema information from a SchemaProvider. Tables, whether
+        found or just created, are cached by the adapter for
+        TABLE_CACHE_TTL seconds, so repeated calls make no API requests.
         """
         if isinstance(table_ref, str):
             table_ref = bigquery.TableReference.from_string(table_ref)
 
+        cache_key = str(table_ref)
+        with self._table_lock:
+            table = self._table_cache.get(cache_key)
+            if table is None:
+                table = self._get_or_create_table(table_ref)
+                self._table_cache[cache_key] = table
+        return table
+
+    def invalidate(self, table_ref: bigquery.TableReference | str) -> None:
+        """
+        Drops a cached table, so that the next write resolves it again.
+        Used when a table is deleted or its schema changes.
+        """
+        with self._table_lock:
+            self._table_cache.pop(str(table_ref), None)
+
+    def provision(self, table_names: list[str]) -> None:
+        """
+        Creates the dataset and the given tables of the adapter if they do
+        not exist. Meant to be called once on startup, so that writes do
+        not need to check for the tables.
+        """
+        for table_name in table_names:
+            self.create_table_if_not_exists(self._get_table_ref(table_name))
+
+    def _get_or_create_table(
+        self, table_ref: bigquery.TableReference
+    ) -> bigquery.Table:
+        """
+        Retrieves the table, creating it from its SchemaProvider metadata
+        if it does not exist.
+        """
         self.ensure_dataset_exists()
 
         try:
@@ -588,7 +774,7 @@ class BigQueryAdapter:
             table_metadata = schema_provider.get_table_metadata(
                 table_ref.table_id
             )
-            table = bigquery.Table(table_ref, table_metadata["schema"])
+            table = bigquery.Table(table_ref, list(table_metadata["schema"]))
             if table_metadata.get("is_partitioned", False):
                 table.time_partitioning = bigquery.TimePartitioning(
                     field=table_metadata["partition_column"]
@@ -596,7 +782,11 @@ class BigQueryAdapter:
                 table.require_partition_filter = table_metadata[
                     "require_partition_filter"
                 ]
-            return self._client.create_table(table)
+            if "clustering_fields" in table_metadata:
+                table.clustering_fields = list(
+                    table_metadata["clustering_fields"]
+                )
+            return self._client.create_table(table, exists_ok=True)
 
     def check_if_table_or_view_exists(
         self, ref: bigquery.TableReference
@@ -634,7 +824,9 @@ class BigQueryAdapter:
             )
             return view
         except NotFound:
-            sql = ViewSQLStatements.get_sql(view_ref)
+            sql = ViewSQLStatements.get_sql(
+                view_ref, self.partition_lookback_days
+            )
             job = self._client.query(sql)
             job.result()
 
@@ -652,48 +844,159 @@ class BigQueryAdapter:
         creation_date: date = None,
     ) -> None:
         """
-        Writes a list of entities to the specified table.
+        Writes a list of entities to the specified table. Large writes
+        go through a load job instead of streaming inserts. Rows are built
+        lazily while they are being sent.
         """
         table_str_ref = self._get_table_ref(table_id)
         creation_date = date.today() if creation_date is None else creation_date
-        rows = [
-            RowTransformer.from_entity(entity, creation_date)
-            for entity in entities
-        ]
-        self.write_to_table(table_str_ref, rows)
+        rows = (entity.to_bq_row(creation_date) for entity in entities)
+
+        if len(entities) > self.BULK_LOAD_THRESHOLD:
+            self.load_to_table(table_str_ref, rows)
+        else:
+            self.write_to_table(table_str_ref, rows)
 
     @google_api_exception_shield
-    def write_to_table(self, table_id: str, rows: list[dict[str, Any]]) -> None:
+    def write_to_table(
+        self, table_id: str, rows: Iterable[dict[str, Any]]
+    ) -> None:
         """
-        Writes a list of rows to the specified table.
+        Writes rows to the specified table. Rows must only hold
+        JSON-serializable values, with dates as ISO strings. Chunks are
+        taken from the rows as the inserts progress, so at most
+        insert_concurrency chunks are held in memory at a time. The table
+        is expected to exist and is only created once an insert reports
+        it missing.
         """
         table_reference = bigquery.TableReference.from_string(table_id)
-        table = self.create_table_if_not_exists(table_reference)
+        self.refresh()
+
+        rows = iter(rows)
+        errors = []
+        offset = 0
+
+        with ThreadPoolExecutor(
+            max_workers=self.insert_concurrency
+        ) as executor:
+            pending = deque()
+            while chunk := list(islice(rows, self.insert_batch_size)):
+                if len(pending) >= self.insert_concurrency:
+                    errors.extend(pending.popleft().result())
+                pending.append(
+                    executor.submit(
+                        self._insert_chunk, table_reference, chunk, offset
+                    )
+                )
+                offset += len(chunk)
+            for future in pending:
+                errors.extend(future.result())
 
-        retries = self.retry_count
-        delay = self.retry_delay
+        if errors:
+            self._logger.info(
+                "Errors occurred while inserting data: %s", errors
+            )
+        else:
+            self._logger.info(
+                "Data inserted successfully into %s.", table_reference
+            )
 
-        while retries > 0:
+    def _insert_chunk(
+        self,
+        table_reference: bigquery.TableReference,
+        rows: list[dict[str, Any]],
+        offset: int,
+    ) -> list[dict[str, Any]]:
+        """
+        Streams a single chunk of rows into the table. If the table is
+        missing, it is created outside of the retried call, and the insert
+        is then retried while the new table is not yet visible. Returns the
+        insert errors with row indexes relative to the whole write.
+        """
+        try:
             try:
-                errors = self._client.insert_rows(table, rows)
-                if errors:
-                    self._logger.info(
-                        "Errors occurred while inserting data: %s", errors
-                    )
-                else:
-                    self._logger.info(
-                        "Data inserted successfully into %s.", table_reference
-                    )
-                return
+                errors = self._client.insert_rows_json(
+                    table_reference,
+                    rows,
+                    retry=self._insert_retry(retry_missing_table=False),
+                )
             except NotFound:
                 self._logger.info(
-                    "Table not found, retrying... (%s retries left)", retries
+                    "Table %s not found, creating it...", table_reference
+                )
+                self.invalidate(table_reference)
+                self.create_table_if_not_exists(table_reference)
+                errors = self._client.insert_rows_json(
+                    table_reference,
+                    rows,
+                    retry=self._insert_retry(retry_missing_table=True),
                 )
-                time.sleep(delay)
-                delay *= 2
-                retries -= 1
-        raise BigQueryDataRetrievalError(
-            "Data insertion failed: table not found."
+        except RetryError as e:
+            raise BigQueryDataRetrievalError(
+                f"Data insertion failed: {e.cause}"
+            ) from e
+
+        return [{**error, "index": error["index"] + offset} for error in errors]
+
+    def _insert_retry(self, retry_missing_table: bool) -> retries.Retry:
+        """
+        Builds the retry policy of a streaming insert. Transient errors are
+        always retried; NotFound only right after the table was created,
+        while the new table propagates.
+        """
+        return retries.Retry(
+            predicate=(
+                self._is_retryable_insert_error
+                if retry_missing_table
+                else retries.if_transient_error
+            ),
+            initial=self.retry_delay,
+            maximum=60.0,
+            multiplier=2.0,
+            timeout=self.retry_delay * (2**self.retry_count - 1),
+        )
+
+    @staticmethod
+    def _is_retryable_insert_error(exc: Exception) -> bool:
+        """
+        Inserts into a newly created table are retried while it is
+        missing, and on the transient errors retried by default.
+        """
+        return isinstance(exc, NotFound) or retries.if_transient_error(exc)
+
+    @google_api_exception_shield
+    def load_to_table(
+        self, table_id: str, rows: Iterable[dict[str, Any]]
+    ) -> None:
+        """
+        Appends a list of rows to the specified table with a single load
+        job. Load jobs are not billed and have no per-request row limit,
+        which makes them cheaper than streaming for large writes.
+        Rows are encoded to newline-delimited JSON with orjson.
+        """
+        table_reference = bigquery.TableReference.from_string(table_id)
+        table = self.create_table_if_not_exists(table_reference)
+        self.refresh()
+
+        job_config = bigquery.LoadJobConfig(
+            schema=table.schema,
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+        )
+        data = io.BytesIO()
+        row_count = 0
+        for row in rows:
+            data.write(orjson.dumps(row))
+            data.write(b"\n")
+            row_count += 1
+        data.seek(0)
+
+        self._client.load_table_from_file(
+            data, table_reference, job_config=job_config
+        ).result()
+
+        self._logger.info(
+            "Loaded %d rows into %s.", row_count, table_reference
         )
 
     @google_api_exception_shield
@@ -707,10 +1010,7 @@ class BigQueryAdapter:
             table_ref, last_partition_date
         )
 
-        last_partition = [
-            dict(row.items()) for row in last_partition_query_job.result()
-        ]
-        return last_partition
+        return self._download(last_partition_query_job)
 
     def delete_dataset(self) -> None:
         """
@@ -718,3 +1018,5 @@ class BigQueryAdapter:
         """
         dataset_ref = self._get_dataset_ref()
         self._client.delete_dataset(dataset_ref, True)
+        self._dataset_ensured = False
+        self._table_cache.clear()
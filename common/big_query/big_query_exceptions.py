@@ -56,6 +56,14 @@ class BigQueryDataRetrievalError(Exception):
     """
 
 
+# Google API exceptions translated by google_api_exception_shield.
+_TRANSLATED_EXCEPTIONS = {
+    GoogleAPICallError: BigQueryExecutionError,
+    concurrent.futures.TimeoutError: BigQueryTimeoutError,
+}
+_SHIELDED_EXCEPTIONS = tuple(_TRANSLATED_EXCEPTIONS)
+
+
 def google_api_exception_shield(target):
     """
     Decorator to shield a function from exceptions raised by the Google API.
@@ -67,9 +75,14 @@ def google_api_exception_shield(target):
     def inner(*args, **kwargs):
         try:
             return target(*args, **kwargs)
-        except GoogleAPICallError as e:
-            raise BigQueryExecutionError(f"Error: {e}") from e
-        except concurrent.futures.TimeoutError as e:
-            raise BigQueryTimeoutError(f"Error: {e}") from e
+        except _SHIELDED_EXCEPTIONS as e:
+            # The exception matched one of the sources, so a translation
+            # always exists.
+            translated = next(
+                translated
+                for source, translated in _TRANSLATED_EXCEPTIONS.items()
+                if isinstance(e, source)
+            )
+            raise translated(f"Error: {e}") from e
 
     return inner
@@ -23,7 +23,8 @@ Classes:
 """
 
 from enum import StrEnum
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from google.cloud import bigquery
 
@@ -44,225 +45,264 @@ class TableNames(StrEnum):
     CLOUDAUDIT_GOOGLEAPIS_DATA_ACCESS = "cloudaudit_googleapis_com_data_access"
 
 
-class SchemaProvider:
-    """
-    A provider class for managing and retrieving schema information
-    for BigQuery tables.
-    """
-
-    def __init__(self) -> None:
-        """
-        Initializes the SchemaProvider with predefined schemas
-        for specific tables.
-        """
-        self.tables = {
-            TableNames.TAG_TEMPLATES: {
-                "schema": [
-                    bigquery.SchemaField(
-                        name="resourceName",
-                        field_type="STRING",
-                        mode="REQUIRED",
-                        description=(
-                            "Format: projects/:project/locations/"
-                            ":location/tagTemplates/:tagTemplateId"
-                        ),
-                    ),
-                    bigquery.SchemaField(
-                        name="projectId", field_type="STRING", mode="REQUIRED"
-                    ),
-                    bigquery.SchemaField(
-                        name="location", field_type="STRING", mode="REQUIRED"
-                    ),
-                    bigquery.SchemaField(
-                        name="tagTemplateId",
-                        field_type="STRING",
-                        mode="REQUIRED",
-                    ),
-                    bigquery.SchemaField(
-                        name="managingSystem",
-                        field_type="STRING",
-                        mode="REQUIRED",
-                        description="Either DATA_CATALOG or DATAPLEX",
-                    ),
-                    bigquery.SchemaField(
-                        name="isPubliclyReadable", field_type="BOOL"
-                    ),
+_TABLE_DEFINITIONS = {
+    TableNames.TAG_TEMPLATES: {
+        "schema": [
+            bigquery.SchemaField(
+                name="resourceName",
+                field_type="STRING",
+                mode="REQUIRED",
+                description=(
+                    "Format: projects/:project/locations/"
+                    ":location/tagTemplates/:tagTemplateId"
+                ),
+            ),
+            bigquery.SchemaField(
+                name="projectId", field_type="STRING", mode="REQUIRED"
+            ),
+            bigquery.SchemaField(
+                name="location", field_type="STRING", mode="REQUIRED"
+            ),
+            bigquery.SchemaField(
+                name="tagTemplateId",
+                field_type="STRING",
+                mode="REQUIRED",
+            ),
+            bigquery.SchemaField(
+                name="managingSystem",
+                field_type="STRING",
+                mode="REQUIRED",
+                description="Either DATA_CATALOG or DATAPLEX",
+            ),
+            bigquery.SchemaField(
+                name="isPubliclyReadable", field_type="BOOL"
+            ),
+            bigquery.SchemaField(
+                name="createdAt", field_type="DATE", mode="REQUIRED"
+            ),
+        ],
+        "is_partitioned": True,
+        "partition_column": "createdAt",
+        "require_partition_filter": False,
+        "clustering_fields": [
+            "managingSystem",
+            "projectId",
+            "resourceName",
+        ],
+    },
+    TableNames.TAG_TEMPLATES_RESOURCE_MAPPING: {
+        "schema": [
+            bigquery.SchemaField(
+                name="dataCatalogResourceName",
+                field_type="STRING",
+                mode="REQUIRED",
+                description=(
+                    "Format: projects/:project/locations/"
+                    ":location/tagTemplates/:tagTemplateId"
+                ),
+            ),
+            bigquery.SchemaField(
+                name="dataplexResourceName",
+                field_type="STRING",
+                mode="REQUIRED",
+                description=(
+                    "Format: projects/:project/locations/"
+                    "global/aspectTypes/:aspectTypeId"
+                ),
+            ),
+        ],
+        "clustering_fields": ["dataCatalogResourceName"],
+    },
+    TableNames.ENTRY_GROUPS: {
+        "schema": [
+            bigquery.SchemaField(
+                name="resourceName",
+                field_type="STRING",
+                mode="REQUIRED",
+                description=(
+                    "Format: projects/:project/locations/"
+                    ":location/entryGroups/:entryGroupId"
+                ),
+            ),
+            bigquery.SchemaField(
+                name="projectId", field_type="STRING", mode="REQUIRED"
+            ),
+            bigquery.SchemaField(
+                name="location", field_type="STRING", mode="REQUIRED"
+            ),
+            bigquery.SchemaField(
+                name="entryGroupId",
+                field_type="STRING",
+                mode="REQUIRED",
+            ),
+            bigquery.SchemaField(
+                name="managingSystem",
+                field_type="STRING",
+                mode="REQUIRED",
+                description="Either DATA_CATALOG or DATAPLEX",
+            ),
+            bigquery.SchemaField(
+                name="createdAt", field_type="DATE", mode="REQUIRED"
+            ),
+        ],
+        "is_partitioned": True,
+        "partition_column": "createdAt",
+        "require_partition_filter": False,
+        "clustering_fields": [
+            "managingSystem",
+            "projectId",
+            "resourceName",
+        ],
+    },
+    TableNames.ENTRY_GROUPS_RESOURCE_MAPPING: {
+        "schema": [
+            bigquery.SchemaField(
+                name="dataCatalogResourceName",
+                field_type="STRING",
+                mode="REQUIRED",
+                description=(
+                    "Format: projects/:project/locations/"
+                    ":location/entryGroups/:entryGroupId"
+                ),
+            ),
+            bigquery.SchemaField(
+                name="dataplexResourceName",
+                field_type="STRING",
+                mode="REQUIRED",
+                description=(
+                    "Format: projects/:project/locations/"
+                    ":location/entryGroups/:entryGroupId"
+                ),
+            ),
+        ],
+        "clustering_fields": ["dataCatalogResourceName"],
+    },
+    TableNames.PROJECTS: {
+        "schema": [
+            bigquery.SchemaField(
+                name="projectId",
+                field_type="STRING",
+                mode="REQUIRED",
+            ),
+            bigquery.SchemaField(
+                name="projectNumber",
+                field_type="INTEGER",
+                mode="REQUIRED",
+            ),
+            bigquery.SchemaField(
+                name="isDataCatalogApiEnabled",
+                field_type="BOOLEAN",
+                mode="REQUIRED",
+            ),
+            bigquery.SchemaField(
+                name="isDataplexApiEnabled",
+                field_type="BOOLEAN",
+                mode="REQUIRED",
+            ),
+            bigquery.SchemaField(
+                name="ancestry",
+                field_type="RECORD",
+                mode="REPEATED",
+                fields=[
                     bigquery.SchemaField(
-                        name="createdAt", field_type="DATE", mode="REQUIRED"
-                    ),
-                ],
-                "is_partitioned": True,
-                "partition_column": "createdAt",
-                "require_partition_filter": False,
-            },
-            TableNames.TAG_TEMPLATES_RESOURCE_MAPPING: {
-                "schema": [
-                    bigquery.SchemaField(
-                        name="dataCatalogResourceName",
+                        name="type",
                         field_type="STRING",
                         mode="REQUIRED",
-                        description=(
-                            "Format: projects/:project/locations/"
-                            ":location/tagTemplates/:tagTemplateId"
-                        ),
                     ),
                     bigquery.SchemaField(
-                        name="dataplexResourceName",
+                        name="id",
                         field_type="STRING",
                         mode="REQUIRED",
-                        description=(
-                            "Format: projects/:project/locations/"
-                            "global/aspectTypes/:aspectTypeId"
-                        ),
-                    ),
-                ],
-            },
-            TableNames.ENTRY_GROUPS: {
-                "schema": [
-                    bigquery.SchemaField(
-                        name="resourceName",
-                        field_type="STRING",
-                        mode="REQUIRED",
-                        description=(
-                            "Format: projects/:project/locations/"
-                            ":location/entryGroups/:entryGroupId"
-                        ),
-                    ),
-                    bigquery.SchemaField(
-                        name="projectId", field_type="STRING", mode="REQUIRED"
-                    ),
-                    bigquery.SchemaField(
-                        name="location", field_type="STRING", mode="REQUIRED"
-                    ),
-                    bigquery.SchemaField(
-                        name="entryGroupId",
-                        field_type="STRING",
-                        mode="REQUIRED",
-                    ),
-                    bigquery.SchemaField(
-                        name="managingSystem",
-                        field_type="STRING",
-                        mode="REQUIRED",
-                        description="Either DATA_CATALOG or DATAPLEX",
-                    ),
-                    bigquery.SchemaField(
-                        name="createdAt", field_type="DATE", mode="REQUIRED"
                     ),
                 ],
-                "is_partitioned": True,
-                "partition_column": "createdAt",
-                "require_partition_filter": False,
-            },
-            TableNames.ENTRY_GROUPS_RESOURCE_MAPPING: {
-                "schema": [
+            ),
+            bigquery.SchemaField(
+                name="createdAt", field_type="DATE", mode="REQUIRED"
+            ),
+        ],
+        "is_partitioned": True,
+        "partition_column": "createdAt",
+        "require_partition_filter": False,
+        "clustering_fields": ["projectId"],
+    },
+    TableNames.IAM_POLICIES: {
+        "schema": [
+            bigquery.SchemaField(
+                name="resourceName",
+                field_type="STRING",
+                mode="REQUIRED",
+            ),
+            bigquery.SchemaField(
+                name="system",
+                field_type="STRING",
+                mode="REQUIRED",
+            ),
+            bigquery.SchemaField(
+                name="bindings",
+                field_type="RECORD",
+                mode="REPEATED",
+                fields=[
                     bigquery.SchemaField(
-                        name="dataCatalogResourceName",
+                        name="role",
                         field_type="STRING",
                         mode="REQUIRED",
-                        description=(
-                            "Format: projects/:project/locations/"
-                            ":location/entryGroups/:entryGroupId"
-                        ),
                     ),
                     bigquery.SchemaField(
-                        name="dataplexResourceName",
+                        name="members",
                         field_type="STRING",
-                        mode="REQUIRED",
-                        description=(
-                            "Format: projects/:project/locations/"
-                            ":location/entryGroups/:entryGroupId"
-                        ),
-                    ),
-                ],
-            },
-            TableNames.PROJECTS: {
-                "schema": [
-                    bigquery.SchemaField(
-                        name="projectId",
-                        field_type="STRING",
-                        mode="REQUIRED",
-                    ),
-                    bigquery.SchemaField(
-                        name="projectNumber",
-                        field_type="INTEGER",
-                        mode="REQUIRED",
-                    ),
-                    bigquery.SchemaField(
-                        name="isDataCatalogApiEnabled",
-                        field_type="BOOLEAN",
-                        mode="REQUIRED",
-                    ),
-                    bigquery.SchemaField(
-                        name="isDataplexApiEnabled",
-                        field_type="BOOLEAN",
-                        mode="REQUIRED",
-                    ),
-                    bigquery.SchemaField(
-                        name="ancestry",
-                        field_type="RECORD",
                         mode="REPEATED",
-                        fields=[
-                            bigquery.SchemaField(
-                                name="type",
-                                field_type="STRING",
-                                mode="REQUIRED",
-                            ),
-                            bigquery.SchemaField(
-                                name="id",
-                                field_type="STRING",
-                                mode="REQUIRED",
-                            ),
-                        ],
-                    ),
-                    bigquery.SchemaField(
-                        name="createdAt", field_type="DATE", mode="REQUIRED"
                     ),
                 ],
-                "is_partitioned": True,
-                "partition_column": "createdAt",
-                "require_partition_filter": False,
-            },
-            TableNames.IAM_POLICIES: {
-                "schema": [
-                    bigquery.SchemaField(
-                        name="resourceName",
-                        field_type="STRING",
-                        mode="REQUIRED",
-                    ),
-                    bigquery.SchemaField(
-                        name="system",
-                        field_type="STRING",
-                        mode="REQUIRED",
-                    ),
-                    bigquery.SchemaField(
-                        name="bindings",
-                        field_type="RECORD",
-                        mode="REPEATED",
-                        fields=[
-                            bigquery.SchemaField(
-                                name="role",
-                                field_type="STRING",
-                                mode="REQUIRED",
-                            ),
-                            bigquery.SchemaField(
-                                name="members",
-                                field_type="STRING",
-                                mode="REPEATED",
-                            ),
-                        ],
-                    ),
-                ]
-            },
+            ),
+        ],
+        "clustering_fields": ["system", "resourceName"],
+    },
+}
+
+
+def _freeze(metadata: dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Returns a read-only view of table metadata, with lists as tuples.
+    """
+    return MappingProxyType(
+        {
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in metadata.items()
         }
+    )
+
+
+_TABLES: Mapping[TableNames, Mapping[str, Any]] = MappingProxyType(
+    {
+        table_name: _freeze(metadata)
+        for table_name, metadata in _TABLE_DEFINITIONS.items()
+    }
+)
+
 
-    def get_table_metadata(self, table_name: TableNames) -> dict[str, Any]:
+class SchemaProvider:
+    """
+    A provider class for managing and retrieving schema information
+    for BigQuery tables.
+    """
+
+    def __init__(self) -> None:
         """
-        Retrieves the metadata for a specified table.
+        Initializes the SchemaProvider with predefined schemas
+        for specific tables. The schemas are built once per process and
+        shared read-only between instances.
         """
-        table_metadata = self.tables.get(table_name)
+        self.tables = _TABLES
 
-        if table_metadata:
-            return table_metadata
-        raise BigQuerySchemaNotFoundError(
-            f"Schema not found for table {table_name}"
-        )
+    def get_table_metadata(
+        self, table_name: TableNames
+    ) -> Mapping[str, Any]:
+        """
+        Retrieves the metadata for a specified table.
+        """
+        try:
+            return self.tables[table_name]
+        except KeyError:
+            raise BigQuerySchemaNotFoundError(
+                f"Schema not found for table {table_name}"
+            ) from None
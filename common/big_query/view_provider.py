@@ -18,12 +18,14 @@ to create BigQuery views based on predefined templates. It supports views
 such as `entry_groups_view` and `tag_templates_view`.
 """
 
+import textwrap
 from enum import StrEnum
+from functools import lru_cache
 
 from google.cloud import bigquery
 
 from common.big_query.big_query_exceptions import BigQueryViewSQLNotFoundError
-from common.big_query.big_query_adapter import TableNames
+from common.big_query.schema_provider import TableNames
 
 
 class ViewNames(StrEnum):
@@ -38,13 +40,24 @@ class ViewNames(StrEnum):
     IAM_POLICIES_COMPARISON = "iam_policies_comparison"
 
 
+def _compact(sql: str) -> str:
+    """
+    Strips the source indentation and trailing whitespace of a SQL
+    template, so the stored template and the rendered statements only
+    hold the SQL itself.
+    """
+    lines = textwrap.dedent(sql).strip().splitlines()
+    return "\n".join(line.rstrip() for line in lines)
+
+
 class ViewSQLStatements:
     """
     Class for managing SQL templates and generating SQL statements for
     BigQuery views.
     """
 
-    ENTRY_GROUPS_VIEW_SQL = """
+    ENTRY_GROUPS_VIEW_SQL = _compact(
+        """
         CREATE VIEW `{project_id}.{dataset_id}.{view_name}` AS
         SELECT
             eg.resourceName,
@@ -60,9 +73,12 @@ class ViewSQLStatements:
             `{project_id}.{dataset_id}.{entity_mapping_table}` AS egrm
         ON
             eg.resourceName = egrm.dataCatalogResourceName
+        {partition_filter}
         """
+    )
 
-    TAG_TEMPLATES_VIEW_SQL = """
+    TAG_TEMPLATES_VIEW_SQL = _compact(
+        """
         CREATE VIEW `{project_id}.{dataset_id}.{view_name}` AS
         SELECT
             tt.resourceName,
@@ -79,9 +95,12 @@ class ViewSQLStatements:
             `{project_id}.{dataset_id}.{entity_mapping_table}` AS ttrm
         ON
             tt.resourceName = ttrm.dataCatalogResourceName
+        {partition_filter}
         """
+    )
 
-    RESOURCE_INTERACTIONS = """
+    RESOURCE_INTERACTIONS = _compact(
+        """
         CREATE MATERIALIZED VIEW `{project_id}.{dataset_id}.{view_name}`
         OPTIONS (
             enable_refresh = true, 
@@ -90,16 +109,19 @@ class ViewSQLStatements:
         ) AS (
         SELECT
             protopayload_auditlog.resourceName,
-            CASE
-            When ENDS_WITH(protopayload_auditlog.methodName, 'TagTemplate') Then 'TAG_TEMPLATE'
-            When ENDS_WITH(protopayload_auditlog.methodName, 'TagTemplates') Then 'TAG_TEMPLATE'
-            When ENDS_WITH(protopayload_auditlog.methodName, 'TagTemplateField') Then 'TAG_TEMPLATE'
-            When ENDS_WITH(protopayload_auditlog.methodName, 'EntryGroup') Then 'ENTRY_GROUP'
-            When ENDS_WITH(protopayload_auditlog.methodName, 'EntryGroups') Then 'ENTRY_GROUP'
-            When ENDS_WITH(protopayload_auditlog.methodName, 'ListEntries') Then 'ENTRY_GROUP'
-            When ENDS_WITH(protopayload_auditlog.methodName, 'Tag') Then 'TAG'
-            When ENDS_WITH(protopayload_auditlog.methodName, 'Tags') Then 'TAG'
-            When ENDS_WITH(protopayload_auditlog.methodName, 'Entry') Then 'ENTRY'
+            CASE REGEXP_EXTRACT(
+                protopayload_auditlog.methodName,
+                r'(TagTemplateField|TagTemplates?|EntryGroups?|ListEntries|Tags?|Entry)$'
+            )
+            WHEN 'TagTemplate' THEN 'TAG_TEMPLATE'
+            WHEN 'TagTemplates' THEN 'TAG_TEMPLATE'
+            WHEN 'TagTemplateField' THEN 'TAG_TEMPLATE'
+            WHEN 'EntryGroup' THEN 'ENTRY_GROUP'
+            WHEN 'EntryGroups' THEN 'ENTRY_GROUP'
+            WHEN 'ListEntries' THEN 'ENTRY_GROUP'
+            WHEN 'Tag' THEN 'TAG'
+            WHEN 'Tags' THEN 'TAG'
+            WHEN 'Entry' THEN 'ENTRY'
             ELSE ''
             END AS resourceType,
             protopayload_auditlog.methodName,
@@ -113,8 +135,10 @@ class ViewSQLStatements:
         INNER JOIN UNNEST(protopayload_auditlog.authorizationInfo) as authorizationInfo
         );       
         """
+    )
 
-    RESOURCE_INTERACTIONS_SUMMARY = """
+    RESOURCE_INTERACTIONS_SUMMARY = _compact(
+        """
         CREATE VIEW `{project_id}.{dataset_id}.{view_name}` (
         `principal` OPTIONS(description="IAM principal"),
         `totalCalls` OPTIONS(description="Total amount of API calls"),
@@ -139,8 +163,10 @@ class ViewSQLStatements:
         GROUP BY principal
         );
         """
+    )
 
-    IAM_POLICIES_COMPARISON = """
+    IAM_POLICIES_COMPARISON = _compact(
+        """
         CREATE MATERIALIZED VIEW `{project_id}.{dataset_id}.{view_name}`
         OPTIONS (
             enable_refresh = true, 
@@ -170,84 +196,116 @@ class ViewSQLStatements:
             FROM `{project_id}.{dataset_id}.{tag_templates_view}` tt
             WHERE tt.createdAt > "1990-01-01" AND tt.createdAt = (SELECT MAX(createdAt) FROM `{project_id}.{dataset_id}.{tag_templates_view}` WHERE createdAt > "1990-01-01")
         ) res
-        LEFT JOIN `{project_id}.{dataset_id}.{iam_policies_table}` dc_iam 
-            ON res.resourceName = dc_iam.resourceName 
-            AND dc_iam.system = "DATA_CATALOG"
-        LEFT JOIN `{project_id}.{dataset_id}.{iam_policies_table}` dp_iam 
-            ON res.dataplexResourceName = dp_iam.resourceName 
-            AND dp_iam.system = "DATAPLEX"
+        LEFT JOIN (
+            SELECT resourceName, bindings
+            FROM `{project_id}.{dataset_id}.{iam_policies_table}`
+            WHERE system = "DATA_CATALOG"
+        ) dc_iam
+            ON res.resourceName = dc_iam.resourceName
+        LEFT JOIN (
+            SELECT resourceName, bindings
+            FROM `{project_id}.{dataset_id}.{iam_policies_table}`
+            WHERE system = "DATAPLEX"
+        ) dp_iam
+            ON res.dataplexResourceName = dp_iam.resourceName
         )
-    """
+        """
+    )
+
+    # Template of each view, with the tables and views it reads from.
+    _VIEWS = {
+        ViewNames.ENTRY_GROUPS_VIEW: (
+            ENTRY_GROUPS_VIEW_SQL,
+            {
+                "entity_table": TableNames.ENTRY_GROUPS,
+                "entity_mapping_table": (
+                    TableNames.ENTRY_GROUPS_RESOURCE_MAPPING
+                ),
+            },
+        ),
+        ViewNames.TAG_TEMPLATES_VIEW: (
+            TAG_TEMPLATES_VIEW_SQL,
+            {
+                "entity_table": TableNames.TAG_TEMPLATES,
+                "entity_mapping_table": (
+                    TableNames.TAG_TEMPLATES_RESOURCE_MAPPING
+                ),
+            },
+        ),
+        ViewNames.RESOURCE_INTERACTIONS: (
+            RESOURCE_INTERACTIONS,
+            {
+                "cloudaudit_googleapis_data_access": (
+                    TableNames.CLOUDAUDIT_GOOGLEAPIS_DATA_ACCESS
+                ),
+            },
+        ),
+        ViewNames.RESOURCE_INTERACTIONS_SUMMARY: (
+            RESOURCE_INTERACTIONS_SUMMARY,
+            {"resource_interactions_view": ViewNames.RESOURCE_INTERACTIONS},
+        ),
+        ViewNames.IAM_POLICIES_COMPARISON: (
+            IAM_POLICIES_COMPARISON,
+            {
+                "iam_policies_table": TableNames.IAM_POLICIES,
+                "tag_templates_view": ViewNames.TAG_TEMPLATES_VIEW,
+                "entry_groups_view": ViewNames.ENTRY_GROUPS_VIEW,
+            },
+        ),
+    }
 
     @classmethod
-    def get_sql(cls, view_ref: bigquery.TableReference) -> str:
+    def get_sql(
+        cls,
+        view_ref: bigquery.TableReference,
+        partition_window_days: int | None = None,
+    ) -> str:
         """
         Generates the SQL statement for the specified view reference.
+        If partition_window_days is set, the entry groups and tag
+        templates views only expose the partitions of that many last
+        days, so that queries on them never scan older partitions.
+        """
+        return cls._render_sql(
+            view_ref.project,
+            view_ref.dataset_id,
+            view_ref.table_id,
+            partition_window_days,
+        )
+
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _render_sql(
+        cls,
+        project: str,
+        dataset: str,
+        view_name: str,
+        partition_window_days: int | None,
+    ) -> str:
+        """
+        Renders the SQL statement of a view. Statements only depend on
+        the arguments, so they are rendered once per view.
         """
-        format_params = {
-            "project_id": view_ref.project,
-            "dataset_id": view_ref.dataset_id,
-            "view_name": view_ref.table_id,
-            "entity_table": "",
-            "entity_mapping_table": "",
-            "cloudaudit_googleapis_data_access": "",
-            "resource_interactions_view": "",
-            "iam_policies_table": "",
-            "tag_templates_view": "",
-            "entry_groups_view": "",
-        }
-
-        match view_ref.table_id:
-            case ViewNames.ENTRY_GROUPS_VIEW:
-                sql_template = cls.ENTRY_GROUPS_VIEW_SQL
-                format_params.update(
-                    {
-                        "entity_table": TableNames.ENTRY_GROUPS,
-                        "entity_mapping_table": (
-                            TableNames.ENTRY_GROUPS_RESOURCE_MAPPING
-                        ),
-                    }
-                )
-            case ViewNames.TAG_TEMPLATES_VIEW:
-                sql_template = cls.TAG_TEMPLATES_VIEW_SQL
-                format_params.update(
-                    {
-                        "entity_table": TableNames.TAG_TEMPLATES,
-                        "entity_mapping_table": (
-                            TableNames.TAG_TEMPLATES_RESOURCE_MAPPING
-                        ),
-                    }
-                )
-            case ViewNames.RESOURCE_INTERACTIONS:
-                sql_template = cls.RESOURCE_INTERACTIONS
-                format_params.update(
-                    {
-                        "cloudaudit_googleapis_data_access": (
-                            TableNames.CLOUDAUDIT_GOOGLEAPIS_DATA_ACCESS
-                        ),
-                    }
-                )
-            case ViewNames.RESOURCE_INTERACTIONS_SUMMARY:
-                sql_template = cls.RESOURCE_INTERACTIONS_SUMMARY
-                format_params.update(
-                    {
-                        "resource_interactions_view": (
-                            ViewNames.RESOURCE_INTERACTIONS
-                        ),
-                    }
-                )
-            case ViewNames.IAM_POLICIES_COMPARISON:
-                sql_template = cls.IAM_POLICIES_COMPARISON
-                format_params.update(
-                    {
-                        "iam_policies_table": TableNames.IAM_POLICIES,
-                        "tag_templates_view": ViewNames.TAG_TEMPLATES_VIEW,
-                        "entry_groups_view": ViewNames.ENTRY_GROUPS_VIEW,
-                    }
-                )
-            case _:
-                raise BigQueryViewSQLNotFoundError(
-                    f"Unknown view name: {view_ref.table_id}"
-                )
-
-        return sql_template.format(**format_params)
+        view = cls._VIEWS.get(view_name)
+        if view is None:
+            raise BigQueryViewSQLNotFoundError(
+                f"Unknown view name: {view_name}"
+            )
+
+        partition_filter = ""
+        if partition_window_days is not None:
+            partition_filter = (
+                "WHERE createdAt >= DATE_SUB("
+                f"CURRENT_DATE(), INTERVAL {int(partition_window_days)} DAY)"
+            )
+
+        sql_template, sources = view
+        return sql_template.format_map(
+            {
+                "project_id": project,
+                "dataset_id": dataset,
+                "view_name": view_name,
+                "partition_filter": partition_filter,
+                **sources,
+            }
+        )
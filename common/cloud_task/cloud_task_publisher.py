@@ -18,22 +18,34 @@ Google Cloud Tasks.
 The module uses Google Cloud Tasks API to manage task creation and dispatch.
 """
 
-import json
+import hashlib
+import logging
 import os
+import threading
 import time
-from functools import cache
+from functools import cache, lru_cache
+from itertools import count, cycle
 from typing import Iterable
-from math import ceil
 
 import google.auth.transport.requests
+import orjson
 import google.cloud.tasks_v2 as tasks
-from google.api_core.exceptions import NotFound, AlreadyExists
+from google.api_core.exceptions import (
+    AlreadyExists,
+    GoogleAPICallError,
+    NotFound,
+    ResourceExhausted,
+    ServiceUnavailable,
+)
 from google.cloud.tasks_v2 import Queue, RateLimits
 from google.cloud.tasks_v2.services.cloud_tasks.pagers import ListTasksPager
+from google.cloud.tasks_v2.services.cloud_tasks.transports import (
+    CloudTasksGrpcTransport,
+)
 from google.cloud.tasks_v2.types import OidcToken
 
 from common.api.resource_manager_api_adapter import ResourceManagerApiAdapter
-from common.utils import get_logger
+from common.utils import get_logger, fan_out, AimdLimiter
 
 
 class CloudTaskPublisher(object):
@@ -41,6 +53,20 @@ class CloudTaskPublisher(object):
     A publisher class for creating and submitting tasks to Google Cloud Tasks.
     """
 
+    _HEADERS = {"Content-type": "application/json"}
+
+    # Backoff bounds, in seconds, of the readiness probe of a new queue.
+    QUEUE_PROBE_INITIAL_DELAY = 0.5
+    QUEUE_PROBE_MAX_DELAY = 5
+
+    # Errors signalling that Cloud Tasks rejected a task as overloaded; bulk
+    # task creation lowers its concurrency and retries the task after
+    # a backoff. DeadlineExceeded is not retried: the task may have been
+    # created, and a retry of an unnamed task would enqueue it twice.
+    _OVERLOAD_ERRORS = (ResourceExhausted, ServiceUnavailable)
+    MAX_OVERLOAD_RETRIES = 5
+    OVERLOAD_BACKOFF = 1
+
     def __init__(
         self,
         project: str,
@@ -48,22 +74,50 @@ class CloudTaskPublisher(object):
         queue: str,
         max_rps: int = 60,
         wait_after_queue_creation: int = 60,
+        pool_size: int = 4,
     ) -> None:
         """
         Initializes the CloudTaskPublisher with the necessary configuration.
+        Tasks are created round-robin over pool_size clients, each with its
+        own gRPC channel, so that concurrent publishing is not capped by
+        the stream limit of a single connection.
         """
         self.project = project
         self.location = location
         self.queue_name = queue
         self.max_rps = max_rps
         self._wait_after_queue_creation = wait_after_queue_creation
-        self._cloud_task_client = tasks.CloudTasksClient()
+        self._client_pool = [
+            self._create_client() for _ in range(max(pool_size, 1))
+        ]
+        self._next_client = cycle(self._client_pool).__next__
+        self._cloud_task_client = self._client_pool[0]
         self._resource_manager_client = ResourceManagerApiAdapter()
         self._queue_fqn = self.get_queue_fqn(
             self.project, self.location, self.queue_name
         )
+        # Queues known to exist, mapped to the version under which they
+        # were seen: 0 when a task was accepted, or a new number each time
+        # this publisher (re)creates the queue.
+        self._known_queues: dict[str, int] = {}
+        self._queue_versions = count(1)
+        self._queue_lock = threading.Lock()
         self._logger = get_logger()
 
+    @staticmethod
+    def _create_client() -> tasks.CloudTasksClient:
+        """
+        Creates a Cloud Tasks client with its own connection. gRPC shares
+        subchannels between channels with the same target by default, which
+        would put every pooled client on a single HTTP/2 connection.
+        """
+        channel = CloudTasksGrpcTransport.create_channel(
+            options=[("grpc.use_local_subchannel_pool", 1)]
+        )
+        return tasks.CloudTasksClient(
+            transport=CloudTasksGrpcTransport(channel=channel)
+        )
+
     @cache
     def _get_service_account_email(self) -> str:
         """
@@ -81,11 +135,23 @@ class CloudTaskPublisher(object):
         else:
             return credentials.service_account_email
 
+    @cache
+    def _get_oidc_token(self) -> OidcToken:
+        """
+        Builds the OIDC token attached to every task. It only depends on
+        the service account, so it is built once and shared.
+        """
+        return OidcToken(
+            service_account_email=self._get_service_account_email()
+        )
+
+    @lru_cache(maxsize=256)
     def get_queue_fqn(
         self, project: str, location: str, queue_name: str
     ) -> str:
         """
-        Constructs the fully qualified name (FQN) of the queue.
+        Constructs the fully qualified name (FQN) of the queue. The same
+        few queues are addressed by every call, so the names are cached.
         """
         return self._cloud_task_client.queue_path(project, location, queue_name)
 
@@ -96,34 +162,38 @@ class CloudTaskPublisher(object):
         project: str = None,
         location: str = None,
         queue_name: str = None,
+        dedup_key: str | None = None,
     ) -> tasks.Task:
         """
         Creates a task with a JSON payload and adds it to the specified queue.
+        If dedup_key is given, the task is named after its hash, so Cloud
+        Tasks rejects a second task with the same key. The hash spreads the
+        names evenly, unlike sequential IDs that slow down task creation.
         """
         project = project or self.project
         location = location or self.location
         queue_name = queue_name or self.queue_name
 
         url = self._form_service_url(service_name, project, location)
+        body = orjson.dumps(json_payload)
 
         http_request = tasks.HttpRequest(
             {
                 "http_method": tasks.HttpMethod.POST,
                 "url": url,
-                "headers": {
-                    "Content-type": "application/json",
-                },
-                "body": json.dumps(json_payload).encode(),
-                "oidc_token": OidcToken(
-                    service_account_email=self._get_service_account_email()
-                ),
+                "headers": self._HEADERS,
+                "body": body,
+                "oidc_token": self._get_oidc_token(),
             }
         )
 
+        queue_fqn = self.get_queue_fqn(project, location, queue_name)
         task = tasks.Task({"http_request": http_request})
-        queue_fqn = self._cloud_task_client.queue_path(
-            project, location, queue_name
-        )
+        if dedup_key is not None:
+            task_id = hashlib.blake2b(
+                dedup_key.encode(), digest_size=16
+            ).hexdigest()
+            task.name = f"{queue_fqn}/tasks/{task_id}"
 
         create_request = tasks.CreateTaskRequest(
             {
@@ -132,27 +202,106 @@ class CloudTaskPublisher(object):
             }
         )
 
-        if not self.check_queue_exists(project, location, queue_name):
-            self._logger.info(
-                "Queue %s does not exist. "
-                "Queue will be created automatically.",
-                queue_fqn,
-            )
-            self.create_queue(project, location, queue_name)
-
+        client = self._next_client()
+        seen_version = self._known_queues.get(queue_fqn)
         try:
-            task = self._cloud_task_client.create_task(create_request)
+            task = client.create_task(create_request)
+        except NotFound:
+            self._ensure_queue(project, location, queue_name, seen_version)
+            task = client.create_task(create_request)
+
+        self._known_queues.setdefault(queue_fqn, 0)
+        if self._logger.isEnabledFor(logging.INFO):
             self._logger.info(
                 "Created task. Endpoint: %s, payload: %s",
                 url,
-                json.dumps(json_payload),
+                body.decode(),
             )
-        except NotFound as e:
-            self._logger.info("Queue %s does not exist", self._queue_fqn)
-            raise e
 
         return task
 
+    def _ensure_queue(
+        self,
+        project: str,
+        location: str,
+        queue_name: str,
+        seen_version: int | None,
+    ) -> None:
+        """
+        Creates a queue that a task was rejected for. seen_version is the
+        known version of the queue when the task was sent. If another
+        thread has (re)created the queue since then, it is not created
+        again; the thread waits for that creation instead.
+        """
+        queue_fqn = self.get_queue_fqn(project, location, queue_name)
+
+        with self._queue_lock:
+            current_version = self._known_queues.get(queue_fqn)
+            if current_version is not None and current_version != seen_version:
+                return
+
+            self._logger.info(
+                "Queue %s does not exist. "
+                "Queue will be created automatically.",
+                queue_fqn,
+            )
+            self._known_queues.pop(queue_fqn, None)
+            self.create_queue(project, location, queue_name)
+            self._known_queues[queue_fqn] = next(self._queue_versions)
+
+    def create_tasks_bulk(
+        self,
+        json_payloads: list[dict | list],
+        service_name: str,
+        project: str = None,
+        location: str = None,
+        queue_name: str = None,
+        max_workers: int = 32,
+    ) -> list[tasks.Task | GoogleAPICallError]:
+        """
+        Creates a task for every payload concurrently, with up to
+        max_workers requests in flight. The concurrency is halved whenever
+        Cloud Tasks reports it is overloaded and grows back on success.
+        Results keep the payload order; a task that could not be created is
+        returned as its error.
+        """
+        limiter = AimdLimiter(max_workers)
+
+        def create_one(
+            json_payload: dict | list,
+        ) -> tasks.Task | GoogleAPICallError:
+            for attempt in range(self.MAX_OVERLOAD_RETRIES + 1):
+                overloaded = False
+                limiter.acquire()
+                try:
+                    return self.create_task(
+                        json_payload,
+                        service_name,
+                        project,
+                        location,
+                        queue_name,
+                    )
+                except self._OVERLOAD_ERRORS as e:
+                    overloaded = True
+                    error = e
+                except GoogleAPICallError as e:
+                    self._logger.error("Error creating task. %s", e)
+                    return e
+                finally:
+                    limiter.release(overloaded)
+
+                if attempt < self.MAX_OVERLOAD_RETRIES:
+                    time.sleep(self.OVERLOAD_BACKOFF * 2**attempt)
+
+            self._logger.error("Error creating task. %s", error)
+            return error
+
+        return fan_out(
+            create_one,
+            [(json_payload,) for json_payload in json_payloads],
+            max_workers,
+        )
+
     def create_task_by_message_location(
         self,
         json_payload: dict | list,
@@ -196,13 +345,45 @@ class CloudTaskPublisher(object):
             result = self._cloud_task_client.create_queue(
                 request={"parent": parent, "queue": queue}
             )
-            time.sleep(self._wait_after_queue_creation)
             self._logger.info("Created queue: %s", queue_fqn)
+            result = self._wait_queue_ready(
+                queue_fqn, self._wait_after_queue_creation
+            ) or result
         except AlreadyExists:
             result = self._cloud_task_client.get_queue(name=queue_fqn)
 
         return result
 
+    def _wait_queue_ready(self, queue_fqn: str, timeout: float) -> Queue | None:
+        """
+        Polls a newly created queue with exponential backoff until it is
+        running or the timeout elapses. Returns the last fetched queue, or
+        None if it never became visible.
+        """
+        deadline = time.monotonic() + timeout
+        delay = self.QUEUE_PROBE_INITIAL_DELAY
+        queue = None
+
+        while True:
+            try:
+                queue = self._cloud_task_client.get_queue(name=queue_fqn)
+                if queue.state == Queue.State.RUNNING:
+                    return queue
+            except NotFound:
+                pass
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._logger.warning(
+                    "Queue %s is not ready after %s seconds",
+                    queue_fqn,
+                    timeout,
+                )
+                return queue
+
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.QUEUE_PROBE_MAX_DELAY)
+
     def update_queue(
         self,
         project: str = None,
@@ -253,6 +434,7 @@ class CloudTaskPublisher(object):
         except NotFound:
             return False
 
+    @lru_cache(maxsize=128)
     def _form_service_url(
         self, service_name: str, project: str, location: str
     ) -> str:
@@ -263,9 +445,11 @@ class CloudTaskPublisher(object):
 
         return f"https://{service_name}-{project_number}.{location}.run.app"
 
+    @lru_cache(maxsize=128)
     def _get_project_number(self, project: str) -> str:
         """
-        Get the project number using project_id.
+        Get the project number using project_id. Project numbers never
+        change, so they are cached.
         """
         return self._resource_manager_client.get_project_number(project)
 
@@ -312,9 +496,11 @@ class CloudTaskPublisher(object):
         project: str = None,
         location: str = None,
         queue_name: str = None,
+        response_view: tasks.Task.View = tasks.Task.View.BASIC,
     ) -> ListTasksPager:
         """
-        Get messages from the queue.
+        Get messages from the queue. The BASIC view omits the request
+        bodies; callers that read them pass Task.View.FULL.
         """
         project = project or self.project
         location = location or self.location
@@ -323,21 +509,45 @@ class CloudTaskPublisher(object):
         queue_fqn = self.get_queue_fqn(project, location, queue_name)
 
         return self._cloud_task_client.list_tasks(
-            request={"parent": queue_fqn, "response_view": 2}
+            request={"parent": queue_fqn, "response_view": response_view}
         )
 
     def prepare_queues_for_locations(
-        self, msg_locations: Iterable[str], quota: int, quota_consumption: int
+        self,
+        msg_locations: Iterable[str],
+        quota: int,
+        quota_consumption: int,
+        max_workers: int = 32,
     ) -> None:
         """
-        Creates queues for the specified message locations.
+        Creates queues for the specified message locations and purges the
+        ones that already exist. The existence of all queues is checked
+        in one concurrent round before any of them is purged or created.
         """
-        for msg_location in msg_locations:
-            new_queue_name = self.queue_name + "-" + msg_location
-            if self.check_queue_exists(queue_name=new_queue_name):
-                self.purge_queue(queue_name=new_queue_name)
+        queue_names = [
+            self.queue_name + "-" + msg_location
+            for msg_location in dict.fromkeys(msg_locations)
+        ]
+        exists = fan_out(
+            self.check_queue_exists,
+            [(None, None, queue_name) for queue_name in queue_names],
+            max_workers,
+        )
+        existing = {
+            queue_name
+            for queue_name, queue_exists in zip(queue_names, exists)
+            if queue_exists
+        }
+        max_rps = (quota * quota_consumption + 99) // 100
+
+        def prepare_one(queue_name: str) -> None:
+            if queue_name in existing:
+                self.purge_queue(queue_name=queue_name)
             else:
-                self.create_queue(
-                    queue_name=new_queue_name,
-                    max_rps=ceil(quota * (quota_consumption / 100)),
-                )
+                self.create_queue(queue_name=queue_name, max_rps=max_rps)
+
+        fan_out(
+            prepare_one,
+            [(queue_name,) for queue_name in queue_names],
+            max_workers,
+        )
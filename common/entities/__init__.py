@@ -25,6 +25,7 @@ from common.entities.entities import (
     Project,
     Entity,
     ManagingSystem,
+    Binding,
 )
 from common.entities.request_models import (
     ResourceTaskData,
@@ -24,7 +24,10 @@ Classes:
 """
 
 import re
+from datetime import date
 from enum import StrEnum
+from functools import lru_cache
+from typing import NamedTuple, Sequence
 
 from google.cloud import datacatalog
 from google.cloud import asset
@@ -41,11 +44,30 @@ class ManagingSystem(StrEnum):
     DATAPLEX = "DATAPLEX"
 
 
+@lru_cache(maxsize=100_000)
+def _fqn(project_id: str, location: str, kind: str, name: str) -> str:
+    """
+    Constructs a fully qualified resource name. The same names are built
+    repeatedly while a resource is processed, so they are cached.
+    """
+    return f"projects/{project_id}/locations/{location}/{kind}/{name}"
+
+
 class TagTemplate:
     """
     Represents a tag template in the Google Cloud Data Catalog.
     """
 
+    __slots__ = (
+        "resource_name",
+        "dataplex_resource_name",
+        "project_id",
+        "location",
+        "id",
+        "public",
+        "managing_system",
+    )
+
     resource_name: str
     dataplex_resource_name: str | None
     project_id: str
@@ -84,18 +106,14 @@ class TagTemplate:
         """
         Constructs the old fully qualified name for a tag template.
         """
-        return (
-            f"projects/{project_id}/"
-            f"locations/{location}/"
-            f"tagTemplates/{name}"
-        )
+        return _fqn(project_id, location, "tagTemplates", name)
 
     @staticmethod
     def get_new_fqn(project_id: str, _: str, name: str) -> str:
         """
         Constructs a fully qualified name for an aspect type.
         """
-        return f"projects/{project_id}/locations/global/aspectTypes/{name}"
+        return _fqn(project_id, "global", "aspectTypes", name)
 
     @staticmethod
     def parse_tag_template_resource(resource_name: str) -> dict[str, str]:
@@ -140,6 +158,20 @@ class TagTemplate:
             transferred=transferred,
         )
 
+    def to_bq_row(self, creation_date: date) -> dict:
+        """
+        Converts the TagTemplate instance to a BigQuery row.
+        """
+        return {
+            "resourceName": self.resource_name,
+            "projectId": self.project_id,
+            "location": self.location,
+            "tagTemplateId": self.id,
+            "isPubliclyReadable": self.public,
+            "managingSystem": self.managing_system,
+            "createdAt": creation_date.isoformat(),
+        }
+
     def __repr__(self) -> str:
         """
         Returns a string representation of the TagTemplate instance.
@@ -152,6 +184,15 @@ class EntryGroup:
     Represents an entry group in the Google Cloud Data Catalog.
     """
 
+    __slots__ = (
+        "resource_name",
+        "dataplex_resource_name",
+        "project_id",
+        "location",
+        "id",
+        "managing_system",
+    )
+
     resource_name: str
     dataplex_resource_name: str | None
     project_id: str
@@ -187,22 +228,14 @@ class EntryGroup:
         """
         Constructs the old fully qualified name for an entry group.
         """
-        return (
-            f"projects/{project_id}/"
-            f"locations/{location}/"
-            f"entryGroups/{name}"
-        )
+        return _fqn(project_id, location, "entryGroups", name)
 
     @staticmethod
     def get_new_fqn(project_id: str, location: str, name: str) -> str:
         """
         Constructs the new fully qualified name for an entry group.
         """
-        return (
-            f"projects/{project_id}/"
-            f"locations/{location}/"
-            f"entryGroups/{name}"
-        )
+        return _fqn(project_id, location, "entryGroups", name)
 
     @staticmethod
     def parse_entry_group_resource(resource_name: str) -> dict[str, str]:
@@ -246,6 +279,19 @@ class EntryGroup:
             transferred=transferred,
         )
 
+    def to_bq_row(self, creation_date: date) -> dict:
+        """
+        Converts the EntryGroup instance to a BigQuery row.
+        """
+        return {
+            "resourceName": self.resource_name,
+            "projectId": self.project_id,
+            "location": self.location,
+            "entryGroupId": self.id,
+            "managingSystem": self.managing_system,
+            "createdAt": creation_date.isoformat(),
+        }
+
     def __repr__(self) -> str:
         """
         Returns a string representation of the EntryGroup instance.
@@ -266,11 +312,19 @@ class Project:
         ORGANIZATION = "ORGANIZATION"
         FOLDER = "FOLDER"
 
+    __slots__ = (
+        "project_id",
+        "project_number",
+        "data_catalog_api_enabled",
+        "dataplex_api_enabled",
+        "ancestry",
+    )
+
     project_id: str
     project_number: int
     data_catalog_api_enabled: bool
     dataplex_api_enabled: bool
-    ancestry: list[tuple[AncestryType, str]]
+    ancestry: Sequence[tuple[AncestryType, str]]
 
     def __init__(self, project_id: str, project_number: int) -> None:
         """
@@ -282,7 +336,9 @@ class Project:
         self.dataplex_api_enabled = False
         self.ancestry = []
 
-    def set_ancestry(self, ancestry: list[tuple[AncestryType, str]]) -> None:
+    def set_ancestry(
+        self, ancestry: Sequence[tuple[AncestryType, str]]
+    ) -> None:
         """
         Sets the ancestry of the project.
         """
@@ -346,6 +402,22 @@ class Project:
             "ancestry": self.ancestry,
         }
 
+    def to_bq_row(self, creation_date: date) -> dict:
+        """
+        Converts the Project instance to a BigQuery row.
+        """
+        return {
+            "projectId": self.project_id,
+            "projectNumber": self.project_number,
+            "isDataCatalogApiEnabled": self.data_catalog_api_enabled,
+            "isDataplexApiEnabled": self.dataplex_api_enabled,
+            "ancestry": [
+                {"type": ancestry_type, "id": resource_id}
+                for ancestry_type, resource_id in self.ancestry
+            ],
+            "createdAt": creation_date.isoformat(),
+        }
+
     def __repr__(self) -> str:
         """
         Returns a string representation of the Project instance.
@@ -353,4 +425,13 @@ class Project:
         return f"{self.project_id}, number: {self.project_number}"
 
 
+class Binding(NamedTuple):
+    """
+    Represents a single IAM policy binding of a resource.
+    """
+
+    role: str
+    members: tuple[str, ...]
+
+
 type Entity = Project | TagTemplate | EntryGroup
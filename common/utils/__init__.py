@@ -16,4 +16,10 @@
 Handles common tasks such as CLI argument parsing and logging for applications.
 """
 
-from common.utils.utils import parse_common_args, get_logger, percent
+from common.utils.utils import (
+    parse_common_args,
+    get_logger,
+    percent,
+    fan_out,
+)
+from common.utils.rate_limiter import TokenBucket, AimdLimiter
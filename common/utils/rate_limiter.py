@@ -0,0 +1,146 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides a thread-safe token bucket used to keep outgoing API
+requests within the available quota, and an adaptive concurrency limiter
+that backs off when the API reports it is overloaded.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket. Tokens are refilled continuously at `rate`
+    tokens per second up to `capacity`; every request consumes one token
+    and blocks until a token is available.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """
+        Initializes a full bucket with the given refill rate and capacity.
+        The capacity defaults to one second worth of tokens.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+
+        self.rate = rate
+        self.capacity = max(capacity if capacity is not None else rate, 1)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._condition = threading.Condition()
+
+    def acquire(self, tokens: float = 1) -> None:
+        """
+        Blocks until the requested number of tokens is available
+        and consumes them.
+        """
+        if tokens > self.capacity:
+            raise ValueError("tokens must not exceed the bucket capacity.")
+
+        with self._condition:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                self._condition.wait((tokens - self._tokens) / self.rate)
+
+    def _refill(self) -> None:
+        """
+        Adds the tokens accumulated since the last refill.
+        """
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def __enter__(self) -> "TokenBucket":
+        """
+        Acquires a single token.
+        """
+        self.acquire()
+        return self
+
+    def __exit__(self, *_) -> None:
+        """
+        Tokens are not returned to the bucket.
+        """
+
+
+class AimdLimiter:
+    """
+    A thread-safe concurrency limiter using additive increase,
+    multiplicative decrease. The limit grows by `increase` after every
+    successful request and is multiplied by `decrease` whenever a request
+    is rejected as overloaded, staying between `min_limit` and `max_limit`.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+    ) -> None:
+        """
+        Initializes the limiter at its maximum concurrency.
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min <= max.")
+        if increase <= 0 or not 0 < decrease < 1:
+            raise ValueError("increase must be positive, decrease in (0, 1).")
+
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.increase = increase
+        self.decrease = decrease
+        self._limit = float(max_limit)
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """
+        The number of requests currently allowed in flight.
+        """
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request may be started within the current limit.
+        """
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, overloaded: bool = False) -> None:
+        """
+        Finishes a request and adjusts the limit by its outcome.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if overloaded:
+                self._limit = max(
+                    self.min_limit, self._limit * self.decrease
+                )
+            else:
+                self._limit = min(
+                    self.max_limit, self._limit + self.increase
+                )
+            self._condition.notify_all()
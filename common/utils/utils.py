@@ -19,6 +19,8 @@ and logging setup.
 
 import logging
 from argparse import ArgumentParser, ArgumentTypeError
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
 
 
 def str2bool(v: str) -> bool:
@@ -106,3 +108,20 @@ def get_logger() -> logging.Logger:
     )
     logger = logging.getLogger()
     return logger
+
+
+def fan_out(
+    func: Callable[..., Any],
+    args: list[tuple[Any, ...]],
+    max_workers: int,
+) -> list[Any]:
+    """
+    Calls func for every tuple of arguments using a pool of worker
+    threads. Results keep the input order.
+    """
+    if not args:
+        return []
+
+    workers = min(max_workers, len(args))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda call_args: func(*call_args), args))
@@ -19,6 +19,7 @@ ResourceManagerApiAdapter and BigQueryAdapter to manage project data and
 store it in BigQuery.
 """
 
+import google.auth
 from google.api_core.exceptions import PermissionDenied
 from google.cloud.datacatalog_v1.types.tags import TagTemplate as DataCatalogTagTemplate
 
@@ -35,9 +36,11 @@ class CloudTaskHandler:
 
     def __init__(self) -> None:
         """
-        Initializes the CloudTaskHandler
+        Initializes the CloudTaskHandler. Data Catalog requests are
+        limited by the read quota of the project of the default credentials.
         """
-        self._datacatalog_client = DatacatalogApiAdapter()
+        _, project = google.auth.default()
+        self._datacatalog_client = DatacatalogApiAdapter(quota_project=project)
         self._logger = get_logger()
 
     def handle_cloud_task(
@@ -59,7 +62,7 @@ class CloudTaskHandler:
                     project_id, location, resource_name
                 )
                 entry_group = self._datacatalog_client.get_entry_group(
-                    project_id, location, resource_name
+                    project_id, location, resource_name, use_cache=False
                 )
                 if not entry_group.transferred_to_dataplex:
                     self._logger.info("Entry group %s not transferred", fqn)
@@ -75,7 +78,7 @@ class CloudTaskHandler:
                     project_id, location, resource_name
                 )
                 tag_template = self._datacatalog_client.get_tag_template(
-                    project_id, location, resource_name
+                    project_id, location, resource_name, use_cache=False
                 )
                 if (tag_template.dataplex_transfer_status
                 != DataCatalogTagTemplate.DataplexTransferStatus.TRANSFERRED):
@@ -18,6 +18,7 @@ Module for handling Cloud Tasks related to tag template conversion.
 
 from typing import Any
 
+import google.auth
 from google.api_core.exceptions import GoogleAPICallError
 
 from common.api import DatacatalogApiAdapter
@@ -34,8 +35,11 @@ class CloudTaskHandler:
     def __init__(self) -> None:
         """
         Initializes the CloudTaskHandler with application configuration.
+        Data Catalog requests are limited by the read quota of the project
+        of the default credentials.
         """
-        self.api_client = DatacatalogApiAdapter()
+        _, project = google.auth.default()
+        self.api_client = DatacatalogApiAdapter(quota_project=project)
         self._logger = get_logger()
 
     def handle_cloud_task(
@@ -22,6 +22,7 @@ store it in BigQuery.
 from common.api import DataplexApiAdapter, DatacatalogApiAdapter
 from common.big_query import BigQueryAdapter, TableNames
 from common.entities import (
+    Binding,
     FetchPoliciesTaskData,
     EntryGroup,
     TagTemplate,
@@ -43,7 +44,9 @@ class CloudTaskHandler:
         self.project_name = app_config["project_name"]
         self.dataset_name = app_config["dataset_name"]
         self._dataplex_client = DataplexApiAdapter()
-        self._datacatalog_client = DatacatalogApiAdapter()
+        self._datacatalog_client = DatacatalogApiAdapter(
+            quota_project=self.project_name
+        )
         self._big_query_client = BigQueryAdapter(
             self.project_name,
             app_config["dataset_location"],
@@ -81,7 +84,7 @@ class CloudTaskHandler:
         data = {
             "resourceName": fqn,
             "system": task_data.resource.system,
-            "bindings": policies,
+            "bindings": [binding._asdict() for binding in policies],
         }
 
         table_name = (
@@ -92,7 +95,9 @@ class CloudTaskHandler:
         self._big_query_client.write_to_table(table_name, [data])
         return {"message": "Task processed"}, 200
 
-    def get_policies(self, task_data: FetchPoliciesTaskData) -> list[dict]:
+    def get_policies(
+        self, task_data: FetchPoliciesTaskData
+    ) -> list[Binding]:
         """
         Fetches IAM policies for the given resource based on its type
         and system.
@@ -42,7 +42,9 @@ class CloudTaskHandler:
         self.queue = app_config["queue"]
         self.handler_name = app_config["handler_name"]
         self.dataset_name = app_config["dataset_name"]
-        self.api_client = DatacatalogApiAdapter()
+        self.api_client = DatacatalogApiAdapter(
+            quota_project=self.project_name
+        )
         self._big_query_client = BigQueryAdapter(
             self.project_name,
             app_config["dataset_location"],
@@ -39,7 +39,9 @@ class CloudTaskHandler:
         """
         self.project_name = app_config["project_name"]
         self.dataset_name = app_config["dataset_name"]
-        self._datacatalog_client = DatacatalogApiAdapter()
+        self._datacatalog_client = DatacatalogApiAdapter(
+            quota_project=self.project_name
+        )
         self._big_query_client = BigQueryAdapter(
             self.project_name,
             app_config["dataset_location"],
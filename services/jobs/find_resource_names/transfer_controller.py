@@ -130,9 +130,7 @@ class TransferController:
             ViewNames.TAG_TEMPLATES_VIEW,
         ]
 
-        for table_name in required_tables:
-            table_id = f"{self.project}.{self.dataset_name}.{table_name}"
-            self._big_query_client.create_table_if_not_exists(table_id)
+        self._big_query_client.provision(required_tables)
 
         for view_name in required_views:
             view_id = f"{self.project}.{self.dataset_name}.{view_name}"
@@ -0,0 +1,105 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module for testing the bulk deletes of the Dataplex API adapter.
+"""
+
+from typing import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.api_core.exceptions import InternalServerError, NotFound
+
+from common.api import DataplexApiAdapter
+from common.entities import EntryGroup, TagTemplate
+
+
+@pytest.fixture
+def adapter() -> Generator[DataplexApiAdapter, None, None]:
+    """
+    Provides an adapter with a mocked Catalog Service client.
+    """
+    with (
+        patch(
+            "common.api.dataplex_api_adapter.get_catalog_service_client"
+        ) as get_client,
+        patch("common.api.dataplex_api_adapter.discovery.build"),
+    ):
+        get_client.return_value = MagicMock()
+        yield DataplexApiAdapter(max_workers=2)
+
+
+def test_delete_entry_groups_waits_for_operations(
+    adapter: DataplexApiAdapter,
+) -> None:
+    """
+    Test that an entry group is only reported deleted once its delete
+    operation finished, and that a failed operation is reported as its
+    error.
+    """
+    failure = InternalServerError("operation failed")
+    done, failed = MagicMock(), MagicMock()
+    failed.result.side_effect = failure
+    adapter._client.delete_entry_group.side_effect = (
+        lambda name: done if name.endswith("/eg1") else failed
+    )
+
+    errors = adapter.delete_entry_groups(
+        [("project", "us", "eg1"), ("project", "us", "eg2")]
+    )
+
+    done.result.assert_called_once_with(timeout=adapter.DELETE_TIMEOUT)
+    failed.result.assert_called_once_with(timeout=adapter.DELETE_TIMEOUT)
+    assert errors == {
+        EntryGroup.get_new_fqn("project", "us", "eg1"): None,
+        EntryGroup.get_new_fqn("project", "us", "eg2"): failure,
+    }
+
+
+def test_delete_aspect_types_collects_errors(
+    adapter: DataplexApiAdapter,
+) -> None:
+    """
+    Test that missing aspect types count as deleted, and that a rejected
+    or timed out delete is reported without failing the batch.
+    """
+    rejected = InternalServerError("rejected")
+    timed_out = MagicMock()
+    timed_out.result.side_effect = TimeoutError()
+
+    def delete_aspect_type(name: str) -> MagicMock:
+        if name.endswith("/missing"):
+            raise NotFound("missing")
+        if name.endswith("/rejected"):
+            raise rejected
+        return timed_out
+
+    adapter._client.delete_aspect_type.side_effect = delete_aspect_type
+
+    errors = adapter.delete_aspect_types(
+        [
+            ("project", "us", "missing"),
+            ("project", "us", "rejected"),
+            ("project", "us", "slow"),
+        ]
+    )
+
+    assert errors[TagTemplate.get_new_fqn("project", "us", "missing")] is None
+    assert errors[TagTemplate.get_new_fqn("project", "us", "rejected")] is (
+        rejected
+    )
+    assert isinstance(
+        errors[TagTemplate.get_new_fqn("project", "us", "slow")], TimeoutError
+    )
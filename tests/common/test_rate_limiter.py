@@ -0,0 +1,136 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module for testing the token bucket rate limiter and the AIMD
+concurrency limiter.
+"""
+
+import threading
+import time
+
+import pytest
+
+from common.utils import TokenBucket, AimdLimiter
+
+
+def test_token_bucket_allows_burst_up_to_capacity() -> None:
+    """
+    Test that a full bucket serves `capacity` requests without waiting.
+    """
+    bucket = TokenBucket(rate=1, capacity=5)
+
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+
+    assert time.monotonic() - start < 0.5
+
+
+def test_token_bucket_throttles_when_empty() -> None:
+    """
+    Test that requests beyond the capacity wait for the bucket to refill.
+    """
+    bucket = TokenBucket(rate=20, capacity=1)
+
+    start = time.monotonic()
+    for _ in range(3):
+        with bucket:
+            pass
+
+    assert time.monotonic() - start >= 0.09
+
+
+@pytest.mark.parametrize("rate", [0, -1])
+def test_token_bucket_rejects_non_positive_rate(rate: float) -> None:
+    """
+    Test that a non-positive refill rate raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        TokenBucket(rate=rate)
+
+
+def test_token_bucket_rejects_request_above_capacity() -> None:
+    """
+    Test that requesting more tokens than the capacity raises a ValueError.
+    """
+    bucket = TokenBucket(rate=1, capacity=2)
+
+    with pytest.raises(ValueError):
+        bucket.acquire(3)
+
+
+def test_aimd_limiter_halves_limit_on_overload() -> None:
+    """
+    Test that an overloaded request multiplicatively shrinks the limit,
+    but never below the minimum.
+    """
+    limiter = AimdLimiter(max_limit=8)
+
+    for expected in (4, 2, 1, 1):
+        limiter.acquire()
+        limiter.release(overloaded=True)
+        assert limiter.limit == expected
+
+
+def test_aimd_limiter_grows_limit_on_success() -> None:
+    """
+    Test that successful requests additively grow the limit back up to
+    the maximum.
+    """
+    limiter = AimdLimiter(max_limit=2)
+    limiter.acquire()
+    limiter.release(overloaded=True)
+    assert limiter.limit == 1
+
+    for expected in (1, 2, 2):
+        limiter.acquire()
+        limiter.release()
+        assert limiter.limit == expected
+
+
+def test_aimd_limiter_blocks_above_limit() -> None:
+    """
+    Test that acquiring beyond the limit waits for a release.
+    """
+    limiter = AimdLimiter(max_limit=1)
+    limiter.acquire()
+
+    acquired = threading.Event()
+    worker = threading.Thread(
+        target=lambda: (limiter.acquire(), acquired.set())
+    )
+    worker.start()
+
+    assert not acquired.wait(0.1)
+    limiter.release()
+    assert acquired.wait(1)
+    worker.join()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_limit": 0},
+        {"max_limit": 2, "min_limit": 3},
+        {"max_limit": 2, "increase": 0},
+        {"max_limit": 2, "decrease": 1},
+    ],
+)
+def test_aimd_limiter_rejects_invalid_parameters(kwargs: dict) -> None:
+    """
+    Test that invalid limits or adjustment factors raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        AimdLimiter(**kwargs)
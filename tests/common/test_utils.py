@@ -0,0 +1,41 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module for testing the common helper functions.
+"""
+
+import time
+
+from common.utils import fan_out
+
+
+def test_fan_out_keeps_input_order() -> None:
+    """
+    Test that results are returned in the order of the arguments.
+    """
+    def slow_square(n: int) -> int:
+        time.sleep(0.01 * (5 - n))
+        return n * n
+
+    result = fan_out(slow_square, [(n,) for n in range(5)], max_workers=5)
+
+    assert result == [0, 1, 4, 9, 16]
+
+
+def test_fan_out_with_no_arguments() -> None:
+    """
+    Test that an empty argument list returns an empty result.
+    """
+    assert not fan_out(lambda: None, [], max_workers=4)
@@ -75,7 +75,7 @@ class TestFetchPoliciesHandler:
         }
 
         handler._datacatalog_client._client = DatacatalogApiMock(test_data)
-        handler._dataplex_client._plain_client = DataplexApiMock(test_data)
+        handler._dataplex_client._client = DataplexApiMock(test_data)
 
         return handler
 
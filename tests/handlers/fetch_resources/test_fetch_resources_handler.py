@@ -23,6 +23,7 @@ from datetime import date
 from unittest.mock import MagicMock
 
 import pytest
+from google.cloud.tasks_v2 import Task
 
 from common.big_query import BigQueryAdapter, TableNames
 from common.cloud_task import CloudTaskPublisher
@@ -230,7 +231,9 @@ class TestCloudTaskHandler:
         assert row.createdAt == date.fromisoformat("2025-01-01")
 
         assert cloud_task_client.check_queue_exists()
-        messages = list(cloud_task_client.get_messages())
+        messages = list(
+            cloud_task_client.get_messages(response_view=Task.View.FULL)
+        )
         assert len(messages) == 1
 
         results = [json.loads(msg.http_request.body) for msg in messages]
@@ -22,6 +22,7 @@ import random
 from typing import Generator
 
 import pytest
+from google.cloud.tasks_v2 import Task
 
 from common.cloud_task import CloudTaskPublisher
 from common.entities import TagTemplate, Project
@@ -213,7 +214,9 @@ class TestConvertPrivateTagTemplatesJob:
 
         controller.start_transfer()
 
-        messages = list(cloud_task_client.get_messages())
+        messages = list(
+            cloud_task_client.get_messages(response_view=Task.View.FULL)
+        )
         test_data = self.generate_result(scope, test_data)
 
         tasks_data = [json.loads(msg.http_request.body) for msg in messages]
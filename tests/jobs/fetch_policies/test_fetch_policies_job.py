@@ -22,6 +22,7 @@ import random
 from typing import Generator
 
 import pytest
+from google.cloud.tasks_v2 import Task
 
 from common.cloud_task import CloudTaskPublisher
 from common.entities import EntryGroup, TagTemplate, Project
@@ -368,7 +369,9 @@ class TestFetchPoliciesJob:
         tasks_data = []
 
         try:
-            messages_from_queue = list(cloud_task_client.get_messages())
+            messages_from_queue = list(
+                cloud_task_client.get_messages(response_view=Task.View.FULL)
+            )
             if messages_from_queue:
                 tasks_data.extend(
                     [
@@ -382,7 +385,8 @@ class TestFetchPoliciesJob:
         try:
             additional_messages = list(
                 cloud_task_client.get_messages(
-                    queue_name=full_config["queue"] + "-us-central1"
+                    queue_name=full_config["queue"] + "-us-central1",
+                    response_view=Task.View.FULL,
                 )
             )
             if additional_messages:
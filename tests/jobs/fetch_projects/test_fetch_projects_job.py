@@ -21,6 +21,7 @@ import random
 from typing import Generator
 
 import pytest
+from google.cloud.tasks_v2 import Task
 
 from services.jobs.fetch_projects.transfer_controller import TransferController
 from tests.mocks.api.cloud_asset_api_mock import CloudAssetApiMock
@@ -71,7 +72,9 @@ class TestFetchProjectsJob:
         controller.start_transfer()
         assert cloud_task_client.check_queue_exists()
 
-        messages = list(cloud_task_client.get_messages())
+        messages = list(
+            cloud_task_client.get_messages(response_view=Task.View.FULL)
+        )
         assert len(messages) == 4
 
         tasks_data = [json.loads(msg.http_request.body) for msg in messages]
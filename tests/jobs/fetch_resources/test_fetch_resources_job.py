@@ -22,6 +22,7 @@ import datetime
 from typing import Generator
 
 import pytest
+from google.cloud.tasks_v2 import Task
 
 from services.jobs.fetch_resources.transfer_controller import TransferController
 from common.cloud_task import CloudTaskPublisher
@@ -143,7 +144,9 @@ class TestFetchResources:
         assert sorted(projects) == project_list
         assert cloud_task_client.check_queue_exists()
 
-        messages = list(cloud_task_client.get_messages())
+        messages = list(
+            cloud_task_client.get_messages(response_view=Task.View.FULL)
+        )
         assert len(messages) == len(expected_results)
 
         tasks_data = [json.loads(msg.http_request.body) for msg in messages]
@@ -7,6 +7,7 @@ import random
 from typing import Generator
 
 import pytest
+from google.cloud.tasks_v2 import Task
 
 from common.big_query import BigQueryAdapter, TableNames, ViewNames
 from common.cloud_task import CloudTaskPublisher
@@ -168,11 +169,13 @@ class TestFindResourceNames:
         messages = list(
             cloud_task_client.get_messages(
                 queue_name=full_config["queue"] + "-us-west1",
+                response_view=Task.View.FULL,
             )
         )
         messages += list(
             cloud_task_client.get_messages(
                 queue_name=full_config["queue"] + "-us-west2",
+                response_view=Task.View.FULL,
             )
         )
         assert len(messages) == len(expected_result)
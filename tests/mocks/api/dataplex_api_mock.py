@@ -15,41 +15,12 @@
 """
 Mock for dataplex client
 """
+from tests.mocks.api.datacatalog_api_mock import DatacatalogApiMock
 
-class DataplexApiMock:
+
+class DataplexApiMock(DatacatalogApiMock):
     """
     Mock for dataplex client
     """
-    def __init__(self, bindings):
-        self.bindings = bindings
-        self.result = None
-
-    def projects(self):
-        return self
-
-    def locations(self):
-        return self
-
-    def aspectTypes(self):
-        return self
-
-    def entryGroups(self):
-        return self
-
-    def getIamPolicy(self, resource):
-        self.result = {
-            "bindings": [
-                {
-                    "role": key,
-                    "members": value
-                }
-                for key, value
-                in self.bindings.get(resource, {}).items()
-            ]
-        }
-        return self
-
-    def execute(self, **_):
-        result = self.result
-        self.result = None
-        return result
+    def get_iam_policy(self, request: dict):
+        return super().get_iam_policy(request["resource"])